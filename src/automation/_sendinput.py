@@ -0,0 +1,93 @@
+"""
+SendInput底层封装
+通过ctypes直接调用user32.SendInput，一次系统调用即可注入一批键鼠事件，
+绕过pyautogui逐键的Python层分发
+"""
+import ctypes
+from ctypes import wintypes
+
+user32 = ctypes.windll.user32
+
+INPUT_MOUSE = 0
+INPUT_KEYBOARD = 1
+
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+KEYEVENTF_UNICODE = 0x0004
+KEYEVENTF_SCANCODE = 0x0008
+
+MAPVK_VK_TO_VSC = 0
+
+# VkKeyScanExW返回SHORT：不声明restype时ctypes按c_int取返回寄存器，
+# x64下高位无保证，-1失败判定和0x100的Shift位都不可靠；
+# HKL是指针宽度的句柄，顺带声明避免截断
+user32.VkKeyScanExW.restype = ctypes.c_short
+user32.VkKeyScanExW.argtypes = (wintypes.WCHAR, wintypes.HKL)
+user32.GetKeyboardLayout.restype = wintypes.HKL
+user32.GetKeyboardLayout.argtypes = (wintypes.DWORD,)
+
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = (
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    )
+
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = (
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_size_t),
+    )
+
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = (
+        ("uMsg", wintypes.DWORD),
+        ("wParamL", wintypes.WORD),
+        ("wParamH", wintypes.WORD),
+    )
+
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = (
+        ("ki", KEYBDINPUT),
+        ("mi", MOUSEINPUT),
+        ("hi", HARDWAREINPUT),
+    )
+
+
+class INPUT(ctypes.Structure):
+    _anonymous_ = ("u",)
+    _fields_ = (
+        ("type", wintypes.DWORD),
+        ("u", _INPUTUNION),
+    )
+
+
+def key_input(vk: int = 0, scan: int = 0, flags: int = 0) -> INPUT:
+    """构造一个键盘INPUT事件"""
+    return INPUT(type=INPUT_KEYBOARD,
+                 ki=KEYBDINPUT(vk, scan, flags, 0, 0))
+
+
+def send_input(events) -> int:
+    """
+    一次性注入一批输入事件
+
+    Args:
+        events: INPUT事件列表
+
+    Returns:
+        实际注入的事件数
+    """
+    n = len(events)
+    arr = (INPUT * n)(*events)
+    return user32.SendInput(n, arr, ctypes.sizeof(INPUT))
@@ -2,11 +2,16 @@
 操作执行器模块
 负责执行自动化操作序列
 """
+import asyncio
 import time
 from typing import Callable, Optional
 from ..models.action import Action, ActionType, ActionSequence
 from .mouse_control import MouseController
-from .keyboard_control import KeyboardController
+from .keyboard_control import (
+    KeyboardController,
+    build_hotkey_events, build_press_events, build_type_events,
+)
+from ._sendinput import send_input
 
 
 class ActionExecutor:
@@ -20,6 +25,19 @@ class ActionExecutor:
         self._on_action_complete: Optional[Callable[[Action, int], None]] = None
         self._on_sequence_complete: Optional[Callable[[], None]] = None
         self._on_error: Optional[Callable[[Exception, Action], None]] = None
+        # 操作类型 -> 处理函数的分发表，替代逐个枚举比较的if/elif链
+        self._handlers: dict = {
+            ActionType.MOUSE_CLICK: self._do_mouse_click,
+            ActionType.MOUSE_DOUBLE_CLICK: self._do_mouse_double_click,
+            ActionType.MOUSE_RIGHT_CLICK: self._do_mouse_right_click,
+            ActionType.MOUSE_MOVE: self._do_mouse_move,
+            ActionType.MOUSE_DRAG: self._do_mouse_drag,
+            ActionType.MOUSE_SCROLL: self._do_mouse_scroll,
+            ActionType.KEYBOARD_TYPE: self._do_keyboard_type,
+            ActionType.KEYBOARD_PRESS: self._do_keyboard_press,
+            ActionType.KEYBOARD_HOTKEY: self._do_keyboard_hotkey,
+            ActionType.DELAY: self._do_delay,
+        }
     
     def set_on_action_start(self, callback: Callable[[Action, int], None]):
         """设置操作开始回调，参数为(action, index)"""
@@ -37,128 +55,295 @@ class ActionExecutor:
         """设置错误回调"""
         self._on_error = callback
     
+    def _do_mouse_click(self, params: dict):
+        self._mouse.click(
+            x=params.get('x'),
+            y=params.get('y'),
+            button=params.get('button', 'left')
+        )
+
+    def _do_mouse_double_click(self, params: dict):
+        self._mouse.double_click(
+            x=params.get('x'),
+            y=params.get('y')
+        )
+
+    def _do_mouse_right_click(self, params: dict):
+        self._mouse.right_click(
+            x=params.get('x'),
+            y=params.get('y')
+        )
+
+    def _do_mouse_move(self, params: dict):
+        self._mouse.move_to(
+            x=params.get('x', 0),
+            y=params.get('y', 0),
+            duration=params.get('duration', 0.25)
+        )
+
+    def _do_mouse_drag(self, params: dict):
+        self._mouse.drag_to(
+            x=params.get('x', 0),
+            y=params.get('y', 0),
+            duration=params.get('duration', 0.5)
+        )
+
+    def _do_mouse_scroll(self, params: dict):
+        self._mouse.scroll(
+            clicks=params.get('amount', 0),
+            x=params.get('x'),
+            y=params.get('y')
+        )
+
+    def _do_keyboard_type(self, params: dict):
+        text = params.get('text', '')
+        interval = params.get('interval', 0.0)
+        # 检查是否包含非ASCII字符（如中文）
+        if not text.isascii():
+            self._keyboard.type_unicode(text, interval)
+        else:
+            self._keyboard.type_text(text, interval)
+
+    def _do_keyboard_press(self, params: dict):
+        self._keyboard.press_key(
+            key=params.get('key', ''),
+            presses=params.get('presses', 1)
+        )
+
+    def _do_keyboard_hotkey(self, params: dict):
+        self._keyboard.hotkey(*params.get('keys', []))
+
+    def _do_delay(self, params: dict):
+        time.sleep(params.get('seconds', 0))
+
     def execute_action(self, action: Action) -> bool:
         """
         执行单个操作
-        
+
         Args:
             action: 要执行的操作
-            
+
         Returns:
             是否成功执行
         """
         if not action.enabled:
             return True
-        
+
         try:
             params = action.params
-            
-            if action.action_type == ActionType.MOUSE_CLICK:
-                self._mouse.click(
-                    x=params.get('x'),
-                    y=params.get('y'),
-                    button=params.get('button', 'left')
-                )
-            
-            elif action.action_type == ActionType.MOUSE_DOUBLE_CLICK:
-                self._mouse.double_click(
-                    x=params.get('x'),
-                    y=params.get('y')
-                )
-            
-            elif action.action_type == ActionType.MOUSE_RIGHT_CLICK:
-                self._mouse.right_click(
-                    x=params.get('x'),
-                    y=params.get('y')
-                )
-            
-            elif action.action_type == ActionType.MOUSE_MOVE:
-                self._mouse.move_to(
-                    x=params.get('x', 0),
-                    y=params.get('y', 0),
-                    duration=params.get('duration', 0.25)
-                )
-            
-            elif action.action_type == ActionType.MOUSE_DRAG:
-                self._mouse.drag_to(
-                    x=params.get('x', 0),
-                    y=params.get('y', 0),
-                    duration=params.get('duration', 0.5)
-                )
-            
-            elif action.action_type == ActionType.MOUSE_SCROLL:
-                self._mouse.scroll(
-                    clicks=params.get('amount', 0),
-                    x=params.get('x'),
-                    y=params.get('y')
-                )
-            
-            elif action.action_type == ActionType.KEYBOARD_TYPE:
-                text = params.get('text', '')
-                interval = params.get('interval', 0.0)
-                # 检查是否包含非ASCII字符（如中文）
-                if any(ord(c) > 127 for c in text):
-                    self._keyboard.type_unicode(text, interval)
-                else:
-                    self._keyboard.type_text(text, interval)
-            
-            elif action.action_type == ActionType.KEYBOARD_PRESS:
-                self._keyboard.press_key(
-                    key=params.get('key', ''),
-                    presses=params.get('presses', 1)
-                )
-            
-            elif action.action_type == ActionType.KEYBOARD_HOTKEY:
-                keys = params.get('keys', [])
-                self._keyboard.hotkey(*keys)
-            
-            elif action.action_type == ActionType.DELAY:
-                seconds = params.get('seconds', 0)
-                time.sleep(seconds)
-            
+
+            handler = self._handlers.get(action.action_type)
+            if handler:
+                handler(params)
+
+            # 可选的操作后暂停（替代pyautogui.PAUSE的全局强制等待）
+            post_pause = params.get('post_pause', 0)
+            if post_pause:
+                time.sleep(post_pause)
+
             return True
-        
+
         except Exception as e:
             if self._on_error:
                 self._on_error(e, action)
             return False
     
+    def _batch_events(self, action: Action):
+        """
+        返回操作对应的可合并INPUT事件列表
+
+        不能合并（鼠标/延迟/Unicode文本/带间隔或post_pause的操作）返回None
+        """
+        params = action.params
+        if params.get('post_pause', 0):
+            return None
+
+        if action.action_type == ActionType.KEYBOARD_PRESS:
+            return build_press_events(
+                params.get('key', ''), params.get('presses', 1))
+
+        if action.action_type == ActionType.KEYBOARD_HOTKEY:
+            return build_hotkey_events(params.get('keys', []))
+
+        if action.action_type == ActionType.KEYBOARD_TYPE:
+            if params.get('interval', 0.0) > 0:
+                return None
+            text = params.get('text', '')
+            if not text.isascii():
+                return None
+            return build_type_events(text)
+
+        return None
+
+    def _compile(self, sequence: ActionSequence):
+        """
+        编译操作序列：连续的键盘操作合并为单次SendInput批次，
+        连续的DELAY合并为一次sleep
+
+        Returns:
+            步骤列表，元素为('batch', [(action, index), ...], events)、
+            ('delay', [(action, index), ...], total_seconds)
+            或('single', action, index)
+        """
+        steps = []
+        batch_actions = []
+        batch_events = []
+        delay_actions = []
+        delay_total = 0.0
+
+        def flush_batch():
+            if batch_actions:
+                steps.append(('batch', list(batch_actions), list(batch_events)))
+                batch_actions.clear()
+                batch_events.clear()
+
+        def flush_delay():
+            nonlocal delay_total
+            if delay_actions:
+                steps.append(('delay', list(delay_actions), delay_total))
+                delay_actions.clear()
+                delay_total = 0.0
+
+        for index, action in enumerate(sequence.actions):
+            # 禁用的操作在编译期剔除：不执行、不触发回调
+            if not action.enabled:
+                continue
+
+            if action.action_type == ActionType.DELAY:
+                flush_batch()
+                delay_actions.append((action, index))
+                delay_total += (action.params.get('seconds', 0) +
+                                action.params.get('post_pause', 0))
+                continue
+
+            events = self._batch_events(action)
+            if events is not None:
+                flush_delay()
+                batch_actions.append((action, index))
+                batch_events.extend(events)
+            else:
+                flush_batch()
+                flush_delay()
+                steps.append(('single', action, index))
+        flush_batch()
+        flush_delay()
+        return steps
+
     def execute_sequence(self, sequence: ActionSequence) -> bool:
         """
         执行操作序列
-        
+
+        Args:
+            sequence: 操作序列
+
+        Returns:
+            是否全部成功执行
+        """
+        self._is_running = True
+        success = True
+
+        # 回调提升为局部变量，循环内不再做属性查找
+        on_start = self._on_action_start
+        on_complete = self._on_action_complete
+        abort_on_error = sequence.abort_on_error
+
+        for step in self._compile(sequence):
+            if not self._is_running:
+                success = False
+                break
+
+            if step[0] == 'batch':
+                _, group, events = step
+                for action, index in group:
+                    if on_start:
+                        on_start(action, index)
+                try:
+                    send_input(events)
+                    result = True
+                except Exception as e:
+                    if self._on_error:
+                        self._on_error(e, group[0][0])
+                    result = False
+                for action, index in group:
+                    if on_complete:
+                        on_complete(action, index)
+            elif step[0] == 'delay':
+                _, group, total_seconds = step
+                for action, index in group:
+                    if on_start:
+                        on_start(action, index)
+                time.sleep(total_seconds)
+                result = True
+                for action, index in group:
+                    if on_complete:
+                        on_complete(action, index)
+            else:
+                _, action, index = step
+                if on_start:
+                    on_start(action, index)
+
+                result = self.execute_action(action)
+
+                if on_complete:
+                    on_complete(action, index)
+
+            if not result:
+                success = False
+                if abort_on_error:
+                    break
+
+        self._is_running = False
+
+        if self._on_sequence_complete:
+            self._on_sequence_complete()
+
+        return success
+    
+    async def execute_sequence_async(self, sequence: ActionSequence) -> bool:
+        """
+        以协程方式执行操作序列
+
+        DELAY操作用asyncio.sleep等待，不占用任何线程；
+        键鼠操作放入线程池执行，避免阻塞事件循环。
+        适合已运行事件循环的宿主（asyncio.run_coroutine_threadsafe调度）
+
         Args:
             sequence: 操作序列
-            
+
         Returns:
             是否全部成功执行
         """
         self._is_running = True
         success = True
-        
+
         for index, action in enumerate(sequence.actions):
             if not self._is_running:
                 success = False
                 break
-            
+
             if self._on_action_start:
                 self._on_action_start(action, index)
-            
-            result = self.execute_action(action)
-            
+
+            if action.enabled and action.action_type == ActionType.DELAY:
+                await asyncio.sleep(action.params.get('seconds', 0) +
+                                    action.params.get('post_pause', 0))
+                result = True
+            else:
+                result = await asyncio.to_thread(self.execute_action, action)
+
             if self._on_action_complete:
                 self._on_action_complete(action, index)
-            
+
             if not result:
                 success = False
-        
+
         self._is_running = False
-        
+
         if self._on_sequence_complete:
             self._on_sequence_complete()
-        
+
         return success
-    
+
     def stop(self):
         """停止执行"""
         self._is_running = False
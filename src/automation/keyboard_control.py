@@ -1,18 +1,178 @@
 """
 键盘控制模块
-使用pyautogui实现键盘操作
+按键/组合键走user32.SendInput直发，文本输入使用pyautogui实现
 """
 import pyautogui
-import pyperclip
+import types
 from typing import List, Union
 import time
 
+from ._sendinput import (
+    KEYEVENTF_KEYUP, KEYEVENTF_UNICODE, MAPVK_VK_TO_VSC,
+    key_input, send_input, user32,
+)
+
+
+# 常用按键名 -> Windows虚拟键码
+_VK_TABLE = {
+    'backspace': 0x08,
+    'tab': 0x09,
+    'enter': 0x0D,
+    'return': 0x0D,
+    'shift': 0x10,
+    'ctrl': 0x11,
+    'alt': 0x12,
+    'capslock': 0x14,
+    'escape': 0x1B,
+    'space': 0x20,
+    'pageup': 0x21,
+    'pagedown': 0x22,
+    'end': 0x23,
+    'home': 0x24,
+    'left': 0x25,
+    'up': 0x26,
+    'right': 0x27,
+    'down': 0x28,
+    'printscreen': 0x2C,
+    'insert': 0x2D,
+    'delete': 0x2E,
+    'win': 0x5B,
+    'f1': 0x70, 'f2': 0x71, 'f3': 0x72, 'f4': 0x73,
+    'f5': 0x74, 'f6': 0x75, 'f7': 0x76, 'f8': 0x77,
+    'f9': 0x78, 'f10': 0x79, 'f11': 0x7A, 'f12': 0x7B,
+    'numlock': 0x90,
+}
+
+
+def _key_pair(vk: int):
+    """构造一个按键的(按下, 释放)INPUT事件对"""
+    scan = user32.MapVirtualKeyW(vk, MAPVK_VK_TO_VSC)
+    return (key_input(vk=vk, scan=scan),
+            key_input(vk=vk, scan=scan, flags=KEYEVENTF_KEYUP))
+
+
+# 导入时预计算：扫描码解析和INPUT构造只做一次，
+# 热路径上命名按键只剩一次dict查找（SendInput会拷贝结构体，实例可安全复用）
+_KEY_PAIRS = {name: _key_pair(vk) for name, vk in _VK_TABLE.items()}
+_SHIFT_PAIR = _KEY_PAIRS['shift']
+
+
+def _canonical(key: str) -> str:
+    """
+    按键名规范化（别名映射+小写化）
+
+    调用方已传规范小写名时直接命中，不产生.lower()的新字符串分配
+    """
+    mapped = KeyboardController.SPECIAL_KEYS.get(key)
+    if mapped is not None:
+        return mapped
+    return KeyboardController.SPECIAL_KEYS.get(key.lower(), key.lower())
+
+
+def _char_pair(ch: str):
+    """
+    按当前键盘布局解析单个字符为((按下, 释放)INPUT事件对, 是否需要Shift)
+
+    区分大小写：'H'解析出h键加Shift位，供文本输入路径逐字符调用；
+    无法解析返回(None, False)
+    """
+    result = user32.VkKeyScanExW(ch, user32.GetKeyboardLayout(0))
+    if result != -1:
+        return _key_pair(result & 0xFF), bool(result & 0x100)
+    return None, False
+
+
+def _lookup_pair(key: str):
+    """
+    把按键名解析为((按下, 释放)INPUT事件对, 是否需要Shift)
+
+    命名按键直接命中预计算缓存，不做任何WinAPI调用；
+    单字符按当前键盘布局用VkKeyScanExW解析（按键名语义，统一小写）；
+    未能解析（如mac的command键）返回(None, False)，由调用方回退到pyautogui
+    """
+    pair = _KEY_PAIRS.get(key)
+    if pair is not None:
+        return pair, False
+    name = _canonical(key)
+    pair = _KEY_PAIRS.get(name)
+    if pair is not None:
+        return pair, False
+    if len(name) == 1:
+        return _char_pair(name)
+    return None, False
+
+
+def build_press_events(key: str, presses: int = 1):
+    """
+    构造press_key对应的INPUT事件列表（供执行器跨操作合并批次）
+
+    无法直发的按键返回None
+    """
+    pair, need_shift = _lookup_pair(key)
+    if pair is None:
+        return None
+    events = [pair[0], pair[1]]
+    if need_shift:
+        events = [_SHIFT_PAIR[0], pair[0], pair[1], _SHIFT_PAIR[1]]
+    return events * presses
+
+
+def build_hotkey_events(keys):
+    """
+    构造组合键对应的INPUT事件列表：全部按下+反序释放
+
+    含无法直发按键时返回None
+    """
+    pairs = []
+    for k in keys:
+        pair, _ = _lookup_pair(k)
+        if pair is None:
+            return None
+        pairs.append(pair)
+    return ([down for down, _ in pairs] +
+            [up for _, up in reversed(pairs)])
+
+
+def build_type_events(text: str):
+    """
+    构造ASCII文本逐字符的INPUT事件列表
+
+    含无法解析字符时返回None
+    """
+    events = []
+    for ch in text:
+        if ch == '\n':
+            pair, need_shift = _KEY_PAIRS['enter'], False
+        elif ch == '\t':
+            pair, need_shift = _KEY_PAIRS['tab'], False
+        else:
+            # 文本按原字符解析，大写字母走Shift位；
+            # 不能用_lookup_pair，那条路按按键名语义做了小写化
+            pair, need_shift = _char_pair(ch)
+        if pair is None:
+            return None
+        if need_shift:
+            events.extend((_SHIFT_PAIR[0], pair[0], pair[1], _SHIFT_PAIR[1]))
+        else:
+            events.extend((pair[0], pair[1]))
+    return events
+
+
+def _unicode_events(text: str):
+    """构造KEYEVENTF_UNICODE的INPUT事件列表（按UTF-16码元逐个按下/释放）"""
+    events = []
+    for unit in memoryview(text.encode('utf-16-le')).cast('H'):
+        events.append(key_input(scan=unit, flags=KEYEVENTF_UNICODE))
+        events.append(key_input(scan=unit,
+                                flags=KEYEVENTF_UNICODE | KEYEVENTF_KEYUP))
+    return events
+
 
 class KeyboardController:
     """键盘控制器"""
     
-    # 常用特殊键映射
-    SPECIAL_KEYS = {
+    # 常用特殊键映射（只读，兼顾别名规范化）
+    SPECIAL_KEYS = types.MappingProxyType({
         'enter': 'enter',
         'return': 'return',
         'tab': 'tab',
@@ -43,7 +203,7 @@ class KeyboardController:
         'numlock': 'numlock',
         'printscreen': 'printscreen',
         'insert': 'insert',
-    }
+    })
     
     @staticmethod
     def type_text(text: str, interval: float = 0.0):
@@ -59,78 +219,108 @@ class KeyboardController:
     @staticmethod
     def type_unicode(text: str, interval: float = 0.0):
         """
-        输入Unicode文本（支持中文等）
-        使用剪贴板方式输入，支持中文、emoji等Unicode字符
-        
+        输入Unicode文本（支持中文、emoji等）
+        通过KEYEVENTF_UNICODE直接注入UTF-16码元，不占用系统剪贴板
+
         Args:
             text: 要输入的文本
             interval: 每个字符之间的间隔（秒）
         """
-        # 保存原剪贴板内容
-        original_clipboard = pyperclip.paste()
-        
-        try:
-            if interval > 0:
-                # 如果有间隔，逐字符输入
-                for char in text:
-                    pyperclip.copy(char)
-                    pyautogui.hotkey('ctrl', 'v')
-                    time.sleep(interval)
-            else:
-                # 一次性输入全部文本
-                pyperclip.copy(text)
-                pyautogui.hotkey('ctrl', 'v')
-        finally:
-            # 恢复原剪贴板内容
-            pyperclip.copy(original_clipboard)
+        if interval > 0:
+            # 如果有间隔，逐字符注入
+            for char in text:
+                send_input(_unicode_events(char))
+                time.sleep(interval)
+        else:
+            # 一次性注入全部文本
+            send_input(_unicode_events(text))
     
     @staticmethod
     def press_key(key: str, presses: int = 1, interval: float = 0.0):
         """
         按下并释放按键
-        
+
         Args:
             key: 按键名称
             presses: 按键次数
             interval: 多次按键之间的间隔
         """
-        key = KeyboardController.SPECIAL_KEYS.get(key.lower(), key.lower())
-        pyautogui.press(key, presses=presses, interval=interval)
-    
+        pair, need_shift = _lookup_pair(key)
+        if pair is None:
+            pyautogui.press(_canonical(key), presses=presses, interval=interval)
+            return
+
+        down, up = pair
+        events = [down, up]
+        if need_shift:
+            events = [_SHIFT_PAIR[0], down, up, _SHIFT_PAIR[1]]
+
+        if interval > 0:
+            for i in range(presses):
+                send_input(events)
+                if i < presses - 1:
+                    time.sleep(interval)
+        else:
+            # 无间隔时把所有次数合并为一次SendInput调用
+            send_input(events * presses)
+
     @staticmethod
     def key_down(key: str):
         """
         按下按键（不释放）
-        
+
         Args:
             key: 按键名称
         """
-        key = KeyboardController.SPECIAL_KEYS.get(key.lower(), key.lower())
-        pyautogui.keyDown(key)
-    
+        pair, _ = _lookup_pair(key)
+        if pair is None:
+            pyautogui.keyDown(_canonical(key))
+            return
+        send_input([pair[0]])
+
     @staticmethod
     def key_up(key: str):
         """
         释放按键
-        
+
         Args:
             key: 按键名称
         """
-        key = KeyboardController.SPECIAL_KEYS.get(key.lower(), key.lower())
-        pyautogui.keyUp(key)
-    
+        pair, _ = _lookup_pair(key)
+        if pair is None:
+            pyautogui.keyUp(_canonical(key))
+            return
+        send_input([pair[1]])
+
     @staticmethod
     def hotkey(*keys: str, interval: float = 0.0):
         """
         按下组合键
-        
+
         Args:
             *keys: 按键序列，如 'ctrl', 'c' 表示 Ctrl+C
             interval: 按键之间的间隔
         """
-        mapped_keys = [KeyboardController.SPECIAL_KEYS.get(k.lower(), k.lower()) 
-                       for k in keys]
-        pyautogui.hotkey(*mapped_keys, interval=interval)
+        pairs = []
+        for k in keys:
+            pair, _ = _lookup_pair(k)
+            if pair is None:
+                pyautogui.hotkey(*[_canonical(x) for x in keys],
+                                 interval=interval)
+                return
+            pairs.append(pair)
+
+        if interval > 0:
+            for down, _ in pairs:
+                send_input([down])
+                time.sleep(interval)
+            for _, up in reversed(pairs):
+                send_input([up])
+                time.sleep(interval)
+        else:
+            # 所有按下+反序释放合并为一次SendInput调用
+            send_input([down for down, _ in pairs] +
+                       [up for _, up in reversed(pairs)])
     
     @staticmethod
     def ctrl_c():
@@ -1,15 +1,34 @@
 """
 鼠标控制模块
-使用pyautogui实现鼠标操作
+使用pyautogui实现鼠标操作，位置/分辨率查询走轻量快路径
 """
+import ctypes
+from ctypes import wintypes
+
 import pyautogui
 from typing import Tuple, Optional
 import time
 
+from ._sendinput import user32
+
 
 # 配置pyautogui的安全设置
 pyautogui.FAILSAFE = True  # 移动鼠标到屏幕角落可以中断
-pyautogui.PAUSE = 0.1  # 每个操作后的默认暂停时间
+pyautogui.PAUSE = 0  # 不做全局强制暂停，需要时通过操作参数post_pause单独指定
+
+# 屏幕分辨率缓存（显示设置变化后由UI层调用invalidate_screen_size刷新）
+_screen_size: Optional[Tuple[int, int]] = None
+
+# GetCursorPos复用同一个POINT结构体，高频轮询时不再每次分配
+# （仅UI线程轮询调用，无并发写入问题）
+_cursor_point = wintypes.POINT()
+_cursor_point_ref = ctypes.byref(_cursor_point)
+
+
+def invalidate_screen_size():
+    """使屏幕分辨率缓存失效（分辨率/DPI变化后调用）"""
+    global _screen_size
+    _screen_size = None
 
 
 class MouseController:
@@ -18,22 +37,28 @@ class MouseController:
     @staticmethod
     def get_position() -> Tuple[int, int]:
         """
-        获取当前鼠标位置
-        
+        获取当前鼠标位置（直接调用GetCursorPos，跳过pyautogui的封装）
+
         Returns:
             (x, y) 坐标元组
         """
+        if user32.GetCursorPos(_cursor_point_ref):
+            return _cursor_point.x, _cursor_point.y
         return pyautogui.position()
-    
+
     @staticmethod
     def get_screen_size() -> Tuple[int, int]:
         """
-        获取屏幕分辨率
-        
+        获取屏幕分辨率（首次查询后缓存）
+
         Returns:
             (width, height) 元组
         """
-        return pyautogui.size()
+        global _screen_size
+        if _screen_size is None:
+            width, height = pyautogui.size()
+            _screen_size = (width, height)
+        return _screen_size
     
     @staticmethod
     def move_to(x: int, y: int, duration: float = 0.25):
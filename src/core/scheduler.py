@@ -3,155 +3,166 @@
 负责管理倒计时和触发关机前的自动化操作
 """
 import threading
+import time
 from typing import Callable, Optional
-from datetime import datetime, timedelta
 
 
 class ShutdownScheduler:
     """定时关机调度器"""
-    
+
     def __init__(self):
-        self._timer: Optional[threading.Timer] = None
-        self._countdown_timer: Optional[threading.Timer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake_event = threading.Event()
+        self._end: float = 0.0
         self._remaining_seconds: int = 0
         self._is_running: bool = False
         self._on_tick_callback: Optional[Callable[[int], None]] = None
         self._on_complete_callback: Optional[Callable[[], None]] = None
         self._on_warning_callback: Optional[Callable[[int], None]] = None
         self._warning_seconds: int = 30  # 最后30秒提醒
+        self._run_id: int = 0
         self._lock = threading.Lock()
-    
+
     @property
     def is_running(self) -> bool:
         """是否正在运行"""
         return self._is_running
-    
+
     @property
     def remaining_seconds(self) -> int:
         """剩余秒数"""
         return self._remaining_seconds
-    
+
     def set_on_tick(self, callback: Callable[[int], None]):
         """设置每秒回调，参数为剩余秒数"""
         self._on_tick_callback = callback
-    
+
     def set_on_complete(self, callback: Callable[[], None]):
         """设置完成回调"""
         self._on_complete_callback = callback
-    
+
     def set_on_warning(self, callback: Callable[[int], None]):
         """设置警告回调，进入最后N秒时触发"""
         self._on_warning_callback = callback
-    
+
     def set_warning_seconds(self, seconds: int):
         """设置提前警告秒数"""
         self._warning_seconds = seconds
-    
+
     def start(self, seconds: int):
         """
         启动倒计时
-        
+
         Args:
             seconds: 倒计时秒数
         """
         if self._is_running:
             self.cancel()
-        
+
         with self._lock:
             self._remaining_seconds = seconds
+            self._end = time.monotonic() + seconds
             self._is_running = True
-        
-        self._start_countdown_tick()
-    
-    def _start_countdown_tick(self):
-        """启动倒计时计时器"""
-        if not self._is_running:
-            return
-        
-        # 先在锁内获取状态和更新剩余时间
-        on_complete = None
-        on_tick = None
-        on_warning = None
-        remaining = 0
-        warning_seconds = 0
-        should_complete = False
-        
-        with self._lock:
-            if self._remaining_seconds <= 0:
-                self._is_running = False
-                on_complete = self._on_complete_callback
-                should_complete = True
-            else:
-                remaining = self._remaining_seconds
-                on_tick = self._on_tick_callback
-                on_warning = self._on_warning_callback
-                warning_seconds = self._warning_seconds
-                self._remaining_seconds -= 1
-        
-        # 在锁外执行回调，避免死锁
-        if should_complete:
-            if on_complete:
+            self._run_id += 1
+            self._wake_event.clear()
+
+        self._start_worker()
+
+    def _start_worker(self):
+        """启动唯一的倒计时工作线程"""
+        self._thread = threading.Thread(
+            target=self._run, args=(self._run_id,), daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, run_id: int):
+        """倒计时主循环，按绝对单调时钟期限对齐每个tick，避免漂移累积
+
+        启动时把回调和期限快照为局部变量，tick热路径不加锁、不做属性查找；
+        锁只在完成判定时使用，以保证与cancel()的先后顺序确定
+        """
+        end = self._end
+        on_tick = self._on_tick_callback
+        on_warning = self._on_warning_callback
+        on_complete = self._on_complete_callback
+        warning_seconds = self._warning_seconds
+        wake_wait = self._wake_event.wait
+        monotonic = time.monotonic
+        warned = False
+
+        while run_id == self._run_id and self._is_running:
+            remaining = max(0, int(round(end - monotonic())))
+            self._remaining_seconds = remaining
+
+            if remaining <= 0:
+                with self._lock:
+                    # 代次校验：cancel()/新的start()之后，旧线程不触发完成回调
+                    if run_id != self._run_id:
+                        return
+                    self._is_running = False
+                if on_complete:
+                    try:
+                        on_complete()
+                    except Exception as e:
+                        print(f"on_complete callback error: {e}")
+                return
+
+            # 触发每秒回调
+            if on_tick:
                 try:
-                    on_complete()
+                    on_tick(remaining)
                 except Exception as e:
-                    print(f"on_complete callback error: {e}")
-            return
-        
-        # 触发每秒回调
-        if on_tick:
-            try:
-                on_tick(remaining)
-            except Exception as e:
-                print(f"on_tick callback error: {e}")
-        
-        # 检查是否进入警告时间
-        if remaining == warning_seconds and on_warning:
-            try:
-                on_warning(remaining)
-            except Exception as e:
-                print(f"on_warning callback error: {e}")
-        
-        # 设置下一秒的定时器
-        if self._is_running:
-            self._countdown_timer = threading.Timer(1.0, self._start_countdown_tick)
-            self._countdown_timer.daemon = True
-            self._countdown_timer.start()
-    
+                    print(f"on_tick callback error: {e}")
+
+            # 检查是否进入警告时间：剩余秒数按时钟推算，tick延迟（负载、
+            # 系统休眠）时可能跳过整数，所以判阈值穿越而不是相等，只触发一次
+            if not warned and remaining <= warning_seconds and on_warning:
+                warned = True
+                try:
+                    on_warning(remaining)
+                except Exception as e:
+                    print(f"on_warning callback error: {e}")
+
+            # 睡眠到下一个tick的绝对期限（end - (remaining - 1)）
+            timeout = (end - (remaining - 1)) - monotonic()
+            if timeout > 0 and wake_wait(timeout):
+                return  # 被cancel/pause唤醒
+
     def cancel(self):
         """取消倒计时"""
         with self._lock:
             self._is_running = False
             self._remaining_seconds = 0
-            
-            if self._countdown_timer:
-                self._countdown_timer.cancel()
-                self._countdown_timer = None
-            
-            if self._timer:
-                self._timer.cancel()
-                self._timer = None
-    
+            self._run_id += 1
+            self._wake_event.set()
+            self._thread = None
+
     def pause(self):
         """暂停倒计时（保留剩余时间）"""
-        if self._countdown_timer:
-            self._countdown_timer.cancel()
-            self._countdown_timer = None
-        self._is_running = False
-    
+        with self._lock:
+            self._is_running = False
+            self._run_id += 1
+            self._wake_event.set()
+            self._thread = None
+
     def resume(self):
         """恢复倒计时"""
         if self._remaining_seconds > 0 and not self._is_running:
-            self._is_running = True
-            self._start_countdown_tick()
-    
+            with self._lock:
+                self._end = time.monotonic() + self._remaining_seconds
+                self._is_running = True
+                self._run_id += 1
+                self._wake_event.clear()
+            self._start_worker()
+
     @staticmethod
     def format_time(seconds: int) -> str:
         """
         格式化时间显示
-        
+
         Args:
             seconds: 秒数
-            
+
         Returns:
             格式化的时间字符串 HH:MM:SS
         """
@@ -159,17 +170,17 @@ class ShutdownScheduler:
         minutes = (seconds % 3600) // 60
         secs = seconds % 60
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    
+
     @staticmethod
     def calculate_seconds(hours: int = 0, minutes: int = 0, seconds: int = 0) -> int:
         """
         计算总秒数
-        
+
         Args:
             hours: 小时
             minutes: 分钟
             seconds: 秒
-            
+
         Returns:
             总秒数
         """
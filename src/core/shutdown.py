@@ -1,166 +1,233 @@
 """
 关机控制模块
-负责执行Windows关机命令
+通过Win32 API直接执行关机/重启/睡眠等操作，API失败时回退到shutdown命令
 """
+import ctypes
 import subprocess
-import os
-from typing import Optional
+from ctypes import wintypes
+from typing import List, Optional
+
+advapi32 = ctypes.windll.advapi32
+kernel32 = ctypes.windll.kernel32
+user32 = ctypes.windll.user32
+powrprof = ctypes.windll.powrprof
+
+TOKEN_ADJUST_PRIVILEGES = 0x0020
+TOKEN_QUERY = 0x0008
+SE_PRIVILEGE_ENABLED = 0x00000002
+SE_SHUTDOWN_NAME = "SeShutdownPrivilege"
+
+EWX_LOGOFF = 0x00000000
+
+# 计划内关机原因，避免被记录为异常关机
+SHTDN_REASON_FLAG_PLANNED = 0x80000000
+
+# 命令行回退路径共用的隐藏窗口配置（构造一次即可）
+_STARTUPINFO = subprocess.STARTUPINFO()
+_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+_STARTUPINFO.wShowWindow = subprocess.SW_HIDE
+
+
+class LUID(ctypes.Structure):
+    _fields_ = (
+        ("LowPart", wintypes.DWORD),
+        ("HighPart", wintypes.LONG),
+    )
+
+
+class LUID_AND_ATTRIBUTES(ctypes.Structure):
+    _fields_ = (
+        ("Luid", LUID),
+        ("Attributes", wintypes.DWORD),
+    )
+
+
+class TOKEN_PRIVILEGES(ctypes.Structure):
+    _fields_ = (
+        ("PrivilegeCount", wintypes.DWORD),
+        ("Privileges", LUID_AND_ATTRIBUTES * 1),
+    )
+
+
+def _enable_shutdown_privilege() -> bool:
+    """启用当前进程的SeShutdownPrivilege权限（关机类API的前提）"""
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(
+            kernel32.GetCurrentProcess(),
+            TOKEN_ADJUST_PRIVILEGES | TOKEN_QUERY,
+            ctypes.byref(token)):
+        return False
+    try:
+        luid = LUID()
+        if not advapi32.LookupPrivilegeValueW(
+                None, SE_SHUTDOWN_NAME, ctypes.byref(luid)):
+            return False
+        privileges = TOKEN_PRIVILEGES(
+            1, (LUID_AND_ATTRIBUTES * 1)(
+                LUID_AND_ATTRIBUTES(luid, SE_PRIVILEGE_ENABLED)))
+        advapi32.AdjustTokenPrivileges(
+            token, False, ctypes.byref(privileges), 0, None, None)
+        return kernel32.GetLastError() == 0
+    finally:
+        kernel32.CloseHandle(token)
 
 
 class ShutdownController:
     """Windows关机控制器"""
-    
+
+    @staticmethod
+    def _run_command(cmd: List[str]) -> bool:
+        """
+        执行命令行回退路径（隐藏窗口）
+
+        Args:
+            cmd: 命令及参数列表
+
+        Returns:
+            是否成功执行命令
+        """
+        try:
+            # 不捕获输出，直接Popen+wait，避免subprocess.run内部的管道开销；
+            # CREATE_NO_WINDOW避免弹出命令行窗口
+            process = subprocess.Popen(
+                cmd,
+                startupinfo=_STARTUPINFO,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                creationflags=subprocess.CREATE_NO_WINDOW,
+            )
+            if process.wait() != 0:
+                print(f"命令执行失败: {cmd}")
+                return False
+            return True
+        except Exception as e:
+            print(f"执行命令时发生错误: {e}")
+            return False
+
+    @staticmethod
+    def _initiate(delay: int, force: bool, message: Optional[str],
+                  reboot: bool) -> bool:
+        """通过InitiateSystemShutdownExW发起关机/重启"""
+        _enable_shutdown_privilege()
+        return bool(advapi32.InitiateSystemShutdownExW(
+            None, message, delay, force, reboot,
+            SHTDN_REASON_FLAG_PLANNED))
+
     @staticmethod
     def shutdown(delay: int = 0, force: bool = False, message: Optional[str] = None) -> bool:
         """
         执行关机命令
-        
+
         Args:
-            delay: 延迟秒数（Windows shutdown命令的/t参数）
+            delay: 延迟秒数
             force: 是否强制关闭应用程序
             message: 关机提示消息
-            
+
         Returns:
             是否成功执行命令
         """
         try:
-            cmd = ["shutdown", "/s", f"/t", str(delay)]
-            
-            if force:
-                cmd.append("/f")
-            
-            if message:
-                cmd.extend(["/c", message])
-            
-            # 使用CREATE_NO_WINDOW避免弹出命令行窗口
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            subprocess.run(cmd, startupinfo=startupinfo, check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"关机命令执行失败: {e}")
-            return False
+            if ShutdownController._initiate(delay, force, message, reboot=False):
+                return True
         except Exception as e:
-            print(f"关机时发生错误: {e}")
-            return False
-    
+            print(f"关机API调用失败: {e}")
+
+        cmd = ["shutdown", "/s", "/t", str(delay)]
+        if force:
+            cmd.append("/f")
+        if message:
+            cmd.extend(["/c", message])
+        return ShutdownController._run_command(cmd)
+
     @staticmethod
     def restart(delay: int = 0, force: bool = False, message: Optional[str] = None) -> bool:
         """
         执行重启命令
-        
+
         Args:
             delay: 延迟秒数
             force: 是否强制关闭应用程序
             message: 重启提示消息
-            
+
         Returns:
             是否成功执行命令
         """
         try:
-            cmd = ["shutdown", "/r", f"/t", str(delay)]
-            
-            if force:
-                cmd.append("/f")
-            
-            if message:
-                cmd.extend(["/c", message])
-            
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            subprocess.run(cmd, startupinfo=startupinfo, check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"重启命令执行失败: {e}")
-            return False
+            if ShutdownController._initiate(delay, force, message, reboot=True):
+                return True
         except Exception as e:
-            print(f"重启时发生错误: {e}")
-            return False
-    
+            print(f"重启API调用失败: {e}")
+
+        cmd = ["shutdown", "/r", "/t", str(delay)]
+        if force:
+            cmd.append("/f")
+        if message:
+            cmd.extend(["/c", message])
+        return ShutdownController._run_command(cmd)
+
     @staticmethod
     def cancel_shutdown() -> bool:
         """
         取消已计划的关机/重启
-        
+
         Returns:
             是否成功取消
         """
         try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            subprocess.run(["shutdown", "/a"], startupinfo=startupinfo, check=True)
-            return True
-        except subprocess.CalledProcessError:
+            _enable_shutdown_privilege()
+            if advapi32.AbortSystemShutdownW(None):
+                return True
             # 可能没有计划的关机任务
             return False
         except Exception as e:
             print(f"取消关机时发生错误: {e}")
             return False
-    
+
     @staticmethod
     def sleep() -> bool:
         """
         使计算机进入睡眠状态
-        
+
         Returns:
             是否成功执行
         """
         try:
-            # 使用rundll32调用睡眠功能
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            subprocess.run(
-                ["rundll32.exe", "powrprof.dll,SetSuspendState", "0", "1", "0"],
-                startupinfo=startupinfo,
-                check=True
-            )
-            return True
+            _enable_shutdown_privilege()
+            if powrprof.SetSuspendState(0, 1, 0):
+                return True
         except Exception as e:
             print(f"睡眠时发生错误: {e}")
-            return False
-    
+        return ShutdownController._run_command(
+            ["rundll32.exe", "powrprof.dll,SetSuspendState", "0", "1", "0"])
+
     @staticmethod
     def hibernate() -> bool:
         """
         使计算机进入休眠状态
-        
+
         Returns:
             是否成功执行
         """
         try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            subprocess.run(["shutdown", "/h"], startupinfo=startupinfo, check=True)
-            return True
+            _enable_shutdown_privilege()
+            if powrprof.SetSuspendState(1, 1, 0):
+                return True
         except Exception as e:
             print(f"休眠时发生错误: {e}")
-            return False
-    
+        return ShutdownController._run_command(["shutdown", "/h"])
+
     @staticmethod
     def logoff() -> bool:
         """
         注销当前用户
-        
+
         Returns:
             是否成功执行
         """
         try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            subprocess.run(["shutdown", "/l"], startupinfo=startupinfo, check=True)
-            return True
+            if user32.ExitWindowsEx(EWX_LOGOFF, SHTDN_REASON_FLAG_PLANNED):
+                return True
         except Exception as e:
             print(f"注销时发生错误: {e}")
-            return False
+        return ShutdownController._run_command(["shutdown", "/l"])
@@ -2,121 +2,199 @@
 操作动作数据模型
 定义自动化操作的类型和数据结构
 """
-from enum import Enum
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, Any, List
+from enum import IntEnum
+from functools import lru_cache, partial
+from typing import Callable, Optional, Dict, Any, List
 import json
-import uuid
+import operator
+import os
+import sys
+import types
 
 
-class ActionType(Enum):
-    """操作类型枚举"""
-    MOUSE_CLICK = "mouse_click"           # 鼠标点击
-    MOUSE_DOUBLE_CLICK = "mouse_double_click"  # 鼠标双击
-    MOUSE_RIGHT_CLICK = "mouse_right_click"    # 鼠标右键点击
-    MOUSE_MOVE = "mouse_move"             # 鼠标移动
-    MOUSE_DRAG = "mouse_drag"             # 鼠标拖拽
-    MOUSE_SCROLL = "mouse_scroll"         # 鼠标滚轮
-    
-    KEYBOARD_TYPE = "keyboard_type"       # 键盘输入文本
-    KEYBOARD_PRESS = "keyboard_press"     # 按键按下
-    KEYBOARD_HOTKEY = "keyboard_hotkey"   # 组合键
-    
-    DELAY = "delay"                       # 延迟等待
-    
+def _new_action_id() -> str:
+    """生成8位十六进制的操作ID"""
+    return os.urandom(4).hex()
+
+
+# 序列化优先使用orjson（C实现，对dict为主的负载快数倍），未安装时回退stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+    _loads = json.loads
+
+
+class ActionType(IntEnum):
+    """操作类型枚举（整数值：比较和哈希是C级整数操作）"""
+    MOUSE_CLICK = 1           # 鼠标点击
+    MOUSE_DOUBLE_CLICK = 2    # 鼠标双击
+    MOUSE_RIGHT_CLICK = 3     # 鼠标右键点击
+    MOUSE_MOVE = 4            # 鼠标移动
+    MOUSE_DRAG = 5            # 鼠标拖拽
+    MOUSE_SCROLL = 6          # 鼠标滚轮
+
+    KEYBOARD_TYPE = 7         # 键盘输入文本
+    KEYBOARD_PRESS = 8        # 按键按下
+    KEYBOARD_HOTKEY = 9       # 组合键
+
+    DELAY = 10                # 延迟等待
+
     def get_display_name(self) -> str:
         """获取显示名称"""
-        names = {
-            ActionType.MOUSE_CLICK: "鼠标点击",
-            ActionType.MOUSE_DOUBLE_CLICK: "鼠标双击",
-            ActionType.MOUSE_RIGHT_CLICK: "鼠标右键",
-            ActionType.MOUSE_MOVE: "鼠标移动",
-            ActionType.MOUSE_DRAG: "鼠标拖拽",
-            ActionType.MOUSE_SCROLL: "鼠标滚轮",
-            ActionType.KEYBOARD_TYPE: "输入文本",
-            ActionType.KEYBOARD_PRESS: "按键",
-            ActionType.KEYBOARD_HOTKEY: "组合键",
-            ActionType.DELAY: "延迟等待",
-        }
-        return names.get(self, self.value)
+        return _DISPLAY_NAMES.get(self, self.name)
+
+
+# 枚举成员 -> JSON序列化用的字符串值（与旧版文件格式保持兼容）
+_TYPE_STR = types.MappingProxyType({
+    ActionType.MOUSE_CLICK: "mouse_click",
+    ActionType.MOUSE_DOUBLE_CLICK: "mouse_double_click",
+    ActionType.MOUSE_RIGHT_CLICK: "mouse_right_click",
+    ActionType.MOUSE_MOVE: "mouse_move",
+    ActionType.MOUSE_DRAG: "mouse_drag",
+    ActionType.MOUSE_SCROLL: "mouse_scroll",
+    ActionType.KEYBOARD_TYPE: "keyboard_type",
+    ActionType.KEYBOARD_PRESS: "keyboard_press",
+    ActionType.KEYBOARD_HOTKEY: "keyboard_hotkey",
+    ActionType.DELAY: "delay",
+})
+
+
+# 显示名称在导入时冻结为只读映射，get_display_name只做一次哈希查找
+_DISPLAY_NAMES = types.MappingProxyType({
+    ActionType.MOUSE_CLICK: "鼠标点击",
+    ActionType.MOUSE_DOUBLE_CLICK: "鼠标双击",
+    ActionType.MOUSE_RIGHT_CLICK: "鼠标右键",
+    ActionType.MOUSE_MOVE: "鼠标移动",
+    ActionType.MOUSE_DRAG: "鼠标拖拽",
+    ActionType.MOUSE_SCROLL: "鼠标滚轮",
+    ActionType.KEYBOARD_TYPE: "输入文本",
+    ActionType.KEYBOARD_PRESS: "按键",
+    ActionType.KEYBOARD_HOTKEY: "组合键",
+    ActionType.DELAY: "延迟等待",
+})
+
+
+# 序列化值 -> 枚举成员的查找表：同时接受旧格式的字符串值和紧凑
+# 格式的整数值，替代ActionType(value)的Python层查找；字符串键做
+# intern以便重复载荷命中指针相等的快路径
+_VALUE_TO_TYPE: Dict[Any, ActionType] = {t.value: t for t in ActionType}
+_VALUE_TO_TYPE.update({sys.intern(s): t for t, s in _TYPE_STR.items()})
+
+
+def _describe_coord(prefix: str, p: Dict[str, Any]) -> str:
+    # 简单整数插值用%格式化，比f-string少一次字符串拼接字节码
+    return "%s (%d, %d)" % (prefix, p.get('x', 0), p.get('y', 0))
+
+
+def _describe_scroll(p: Dict[str, Any]) -> str:
+    amount = p.get('amount', 0)
+    direction = "向上" if amount > 0 else "向下"
+    return f"滚动 {direction} {abs(amount)} 格"
+
+
+def _describe_type(p: Dict[str, Any]) -> str:
+    text = p.get('text', '')
+    if len(text) > 20:
+        text = text[:20] + "..."
+    return f"输入: {text}"
+
+
+# 操作类型 -> 描述生成函数的分发表（替代逐类型比较的if/elif链）；
+# 五种坐标类操作共用一个%格式化的构建函数，只是前缀不同
+_DESCRIPTION_BUILDERS: Dict[ActionType, Callable[[Dict[str, Any]], str]] = {
+    ActionType.MOUSE_CLICK: partial(_describe_coord, "点击位置"),
+    ActionType.MOUSE_DOUBLE_CLICK: partial(_describe_coord, "双击位置"),
+    ActionType.MOUSE_RIGHT_CLICK: partial(_describe_coord, "右键点击"),
+    ActionType.MOUSE_MOVE: partial(_describe_coord, "移动到"),
+    ActionType.MOUSE_DRAG: partial(_describe_coord, "拖拽到"),
+    ActionType.MOUSE_SCROLL: _describe_scroll,
+    ActionType.KEYBOARD_TYPE: _describe_type,
+    ActionType.KEYBOARD_PRESS: lambda p: f"按键: {p.get('key', '')}",
+    ActionType.KEYBOARD_HOTKEY: lambda p: f"组合键: {'+'.join(p.get('keys', []))}",
+    ActionType.DELAY: lambda p: f"等待 {p.get('seconds', 0)} 秒",
+}
 
 
-@dataclass
 class Action:
-    """操作动作数据类"""
-    action_type: ActionType
-    params: Dict[str, Any] = field(default_factory=dict)
-    description: str = ""
-    id: str = field(default_factory=lambda: str(uuid.uuid4())[:8])
-    enabled: bool = True
-    
-    def __post_init__(self):
-        """初始化后处理"""
-        if not self.description:
-            self.description = self._generate_description()
-    
+    """操作动作类"""
+
+    # 固定槽位存储：去掉每实例的__dict__，属性访问更快、内存更省
+    __slots__ = ('action_type', 'params', '_description', 'id', 'enabled')
+
+    def __init__(self, action_type: ActionType,
+                 params: Optional[Dict[str, Any]] = None,
+                 description: str = "",
+                 id: Optional[str] = None,
+                 enabled: bool = True):
+        self.action_type = action_type
+        self.params = params if params is not None else {}
+        self.id = id or _new_action_id()
+        self.enabled = enabled
+        # 描述延迟到首次访问才生成；纯执行类负载可能从不读取
+        self._description = description or None
+
+    @property
+    def description(self) -> str:
+        """操作描述（首次访问时生成并缓存）"""
+        if self._description is None:
+            self._description = self._generate_description()
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value or None
+
+    def __repr__(self):
+        return (f"Action(action_type={self.action_type!r}, "
+                f"params={self.params!r}, id={self.id!r})")
+
+    def __eq__(self, other):
+        if not isinstance(other, Action):
+            return NotImplemented
+        return (self.id == other.id and
+                self.action_type == other.action_type and
+                self.params == other.params and
+                self.description == other.description and
+                self.enabled == other.enabled)
+
+    def __getstate__(self):
+        """pickle支持：导出紧凑元组，替代默认的槽位名->值字典"""
+        return (self.id, self.action_type.value, dict(self.params),
+                self.description, self.enabled)
+
+    def __setstate__(self, state):
+        """pickle恢复：直接写槽位，不重新生成描述"""
+        self.id, value, self.params, self.description, self.enabled = state
+        self.action_type = _VALUE_TO_TYPE.get(value) or ActionType(value)
+
+
     def _generate_description(self) -> str:
         """根据操作类型和参数生成描述"""
-        if self.action_type == ActionType.MOUSE_CLICK:
-            x = self.params.get('x', 0)
-            y = self.params.get('y', 0)
-            return f"点击位置 ({x}, {y})"
-        
-        elif self.action_type == ActionType.MOUSE_DOUBLE_CLICK:
-            x = self.params.get('x', 0)
-            y = self.params.get('y', 0)
-            return f"双击位置 ({x}, {y})"
-        
-        elif self.action_type == ActionType.MOUSE_RIGHT_CLICK:
-            x = self.params.get('x', 0)
-            y = self.params.get('y', 0)
-            return f"右键点击 ({x}, {y})"
-        
-        elif self.action_type == ActionType.MOUSE_MOVE:
-            x = self.params.get('x', 0)
-            y = self.params.get('y', 0)
-            return f"移动到 ({x}, {y})"
-        
-        elif self.action_type == ActionType.MOUSE_DRAG:
-            x = self.params.get('x', 0)
-            y = self.params.get('y', 0)
-            return f"拖拽到 ({x}, {y})"
-        
-        elif self.action_type == ActionType.MOUSE_SCROLL:
-            amount = self.params.get('amount', 0)
-            direction = "向上" if amount > 0 else "向下"
-            return f"滚动 {direction} {abs(amount)} 格"
-        
-        elif self.action_type == ActionType.KEYBOARD_TYPE:
-            text = self.params.get('text', '')
-            if len(text) > 20:
-                text = text[:20] + "..."
-            return f"输入: {text}"
-        
-        elif self.action_type == ActionType.KEYBOARD_PRESS:
-            key = self.params.get('key', '')
-            return f"按键: {key}"
-        
-        elif self.action_type == ActionType.KEYBOARD_HOTKEY:
-            keys = self.params.get('keys', [])
-            return f"组合键: {'+'.join(keys)}"
-        
-        elif self.action_type == ActionType.DELAY:
-            seconds = self.params.get('seconds', 0)
-            return f"等待 {seconds} 秒"
-        
+        builder = _DESCRIPTION_BUILDERS.get(self.action_type)
+        if builder is not None:
+            return builder(self.params)
         return self.action_type.get_display_name()
     
     def update_description(self):
         """更新描述"""
-        self.description = self._generate_description()
+        self._description = self._generate_description()
     
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典"""
         return {
             'id': self.id,
-            'action_type': self.action_type.value,
-            'params': self.params,
+            'action_type': _TYPE_STR[self.action_type],
+            # 拷贝为普通dict：参数可能是工厂缓存的只读视图，且快照后
+            # 不受后续修改影响
+            'params': dict(self.params),
             'description': self.description,
             'enabled': self.enabled
         }
@@ -124,28 +202,98 @@ class Action:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Action':
         """从字典创建"""
+        action_type = data['action_type']
         return cls(
-            id=data.get('id', str(uuid.uuid4())[:8]),
-            action_type=ActionType(data['action_type']),
+            id=data.get('id') or _new_action_id(),
+            action_type=_VALUE_TO_TYPE.get(action_type) or ActionType(action_type),
             params=data.get('params', {}),
             description=data.get('description', ''),
             enabled=data.get('enabled', True)
         )
 
+    @classmethod
+    def _from_dict_fast(cls, data: Dict[str, Any]) -> 'Action':
+        """
+        from_dict的批量加载快路径
+
+        绕过__init__直接写槽位；字典里已带描述时不再重新生成
+        """
+        obj = cls.__new__(cls)
+        obj.id = data.get('id') or _new_action_id()
+        action_type = data['action_type']
+        obj.action_type = _VALUE_TO_TYPE.get(action_type) or ActionType(action_type)
+        obj.params = data.get('params', {})
+        obj.enabled = data.get('enabled', True)
+        obj._description = data.get('description') or None
+        return obj
+
+    def to_tuple(self) -> tuple:
+        """
+        转换为紧凑元组 (id, 类型值, 参数[, 描述[, 是否启用]])
+
+        尾部取默认值的字段直接省略：未生成过的描述不写出（加载后
+        仍按需生成），enabled只在为False时出现
+        """
+        head = (self.id, self.action_type.value, dict(self.params))
+        if not self.enabled:
+            return head + (self._description, False)
+        if self._description is not None:
+            return head + (self._description,)
+        return head
+
+    @classmethod
+    def from_tuple(cls, data) -> 'Action':
+        """从紧凑元组创建（字段按位置还原，缺省的尾部字段补默认值）"""
+        obj = cls.__new__(cls)
+        obj.id = data[0]
+        obj.action_type = _VALUE_TO_TYPE.get(data[1]) or ActionType(data[1])
+        obj.params = data[2]
+        n = len(data)
+        obj._description = data[3] if n > 3 else None
+        obj.enabled = data[4] if n > 4 else True
+        return obj
+
+
+# 批量序列化用的字段抓取器：C实现的一次五字段读取，
+# 省去逐个操作的to_dict绑定方法调度
+_ACTION_FIELDS = operator.attrgetter('id', 'action_type', 'params',
+                                     'description', 'enabled')
+# 紧凑模式读裸槽位_description，不触发property把描述提前物化
+_ACTION_RAW_FIELDS = operator.attrgetter('id', 'action_type', 'params',
+                                         '_description', 'enabled')
+
+
+# 超过该大小的JSON文件优先流式解析（需安装ijson），
+# 避免原始字节和解析结果同时驻留内存
+_STREAM_THRESHOLD = 1 << 20
+
 
-@dataclass
 class ActionSequence:
     """操作序列"""
-    name: str = "未命名序列"
-    actions: List[Action] = field(default_factory=list)
-    
+
+    __slots__ = ('name', 'actions', 'abort_on_error', '_by_id')
+
+    def __init__(self, name: str = "未命名序列",
+                 actions: Optional[List[Action]] = None,
+                 abort_on_error: bool = False):
+        self.name = name
+        self.actions = actions if actions is not None else []
+        # 任一操作失败时是否中止整个序列
+        self.abort_on_error = abort_on_error
+        # id -> Action索引，使get_action从线性扫描降为O(1)查找
+        self._by_id: Dict[str, Action] = {a.id: a for a in self.actions}
+
+
     def add_action(self, action: Action):
         """添加操作"""
         self.actions.append(action)
-    
+        self._by_id[action.id] = action
+
     def remove_action(self, action_id: str):
         """移除操作"""
-        self.actions = [a for a in self.actions if a.id != action_id]
+        action = self._by_id.pop(action_id, None)
+        if action is not None:
+            self.actions.remove(action)
     
     def move_action(self, from_index: int, to_index: int):
         """移动操作位置"""
@@ -155,49 +303,146 @@ class ActionSequence:
     
     def get_action(self, action_id: str) -> Optional[Action]:
         """获取操作"""
-        for action in self.actions:
-            if action.id == action_id:
-                return action
-        return None
-    
+        return self._by_id.get(action_id)
+
     def clear(self):
         """清空所有操作"""
         self.actions.clear()
+        self._by_id.clear()
     
-    def to_dict(self) -> Dict[str, Any]:
-        """转换为字典"""
+    def to_dict(self, compact: bool = False) -> Dict[str, Any]:
+        """
+        转换为字典
+
+        Args:
+            compact: 为True时操作序列化为扁平元组（v2格式），
+                     省去每个操作的5个键名，体积更小、编解码更快
+        """
+        if compact:
+            return {
+                'v': 2,
+                'name': self.name,
+                'abort_on_error': self.abort_on_error,
+                # 尾部默认值字段省略：见Action.to_tuple
+                'actions': [
+                    (i, t.value, dict(p), d, False) if not e
+                    else (i, t.value, dict(p), d) if d is not None
+                    else (i, t.value, dict(p))
+                    for i, t, p, d, e in map(_ACTION_RAW_FIELDS, self.actions)]
+            }
         return {
             'name': self.name,
-            'actions': [a.to_dict() for a in self.actions]
+            'abort_on_error': self.abort_on_error,
+            'actions': [{'id': i, 'action_type': _TYPE_STR[t],
+                         'params': dict(p), 'description': d, 'enabled': e}
+                        for i, t, p, d, e in map(_ACTION_FIELDS, self.actions)]
         }
-    
+
+    def _reset_actions(self, actions: List[Action]):
+        """整体替换操作列表并重建id索引"""
+        self.actions = actions
+        self._by_id = {a.id: a for a in actions}
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ActionSequence':
-        """从字典创建"""
-        sequence = cls(name=data.get('name', '未命名序列'))
-        for action_data in data.get('actions', []):
-            sequence.add_action(Action.from_dict(action_data))
+        """从字典创建（按'v'键自动识别紧凑格式）"""
+        sequence = cls(name=data.get('name', '未命名序列'),
+                       abort_on_error=data.get('abort_on_error', False))
+        items = data.get('actions', ())
+        if data.get('v', 1) >= 2:
+            sequence._reset_actions([Action.from_tuple(a) for a in items])
+        else:
+            # 批量加载走快路径构造，避免逐个add_action的追加/索引更新
+            sequence._reset_actions([Action._from_dict_fast(a) for a in items])
         return sequence
     
     def save_to_file(self, filepath: str):
         """保存到文件"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
-    
+        with open(filepath, 'wb') as f:
+            f.write(_dumps(self.to_dict()))
+
+    def save_to_file_binary(self, filepath: str):
+        """
+        保存为MessagePack二进制文件（比JSON更小、编解码更快）
+
+        需要安装可选依赖msgpack
+        """
+        import msgpack
+        with open(filepath, 'wb') as f:
+            msgpack.pack(self.to_dict(), f, use_bin_type=True)
+
     @classmethod
     def load_from_file(cls, filepath: str) -> 'ActionSequence':
-        """从文件加载"""
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        """
+        从文件加载（按内容自动识别JSON/MessagePack格式）
+
+        大JSON文件在安装了ijson时改为流式解析，边读边构造Action
+        """
+        with open(filepath, 'rb') as f:
+            if (f.read(1) == b'{' and
+                    os.path.getsize(filepath) > _STREAM_THRESHOLD):
+                try:
+                    import ijson
+                except ImportError:
+                    pass
+                else:
+                    f.seek(0)
+                    return cls._load_streaming(f, ijson)
+            f.seek(0)
+            raw = f.read()
+        # JSON文本以'{'开头（允许前导空白），其余按MessagePack解析
+        if raw.lstrip()[:1] == b'{':
+            return cls.from_dict(_loads(raw))
+        import msgpack
+        return cls.from_dict(msgpack.unpackb(raw, raw=False))
+
+    @classmethod
+    def _load_streaming(cls, f, ijson) -> 'ActionSequence':
+        """ijson流式解析：逐个产出Action，不把整份JSON载入内存"""
+        sequence = cls()
+        builder = None
+        for prefix, event, value in ijson.parse(f):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix == 'actions.item' and event in ('end_map', 'end_array'):
+                    item = builder.value
+                    builder = None
+                    if isinstance(item, dict):
+                        sequence.add_action(Action._from_dict_fast(item))
+                    else:
+                        sequence.add_action(Action.from_tuple(item))
+            elif prefix == 'actions.item' and event in ('start_map', 'start_array'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            elif prefix == 'name':
+                sequence.name = value
+            elif prefix == 'abort_on_error':
+                sequence.abort_on_error = value
+        return sequence
+
+    @classmethod
+    def load_from_file_binary(cls, filepath: str) -> 'ActionSequence':
+        """从MessagePack二进制文件加载"""
+        import msgpack
+        with open(filepath, 'rb') as f:
+            data = msgpack.unpack(f, raw=False)
         return cls.from_dict(data)
 
 
+# 工厂参数字典缓存：宏生成等场景反复产生同参数操作时命中缓存，
+# 不再每次分配新dict；返回只读视图，调用方原地修改会直接报错而
+# 不会污染缓存（UI编辑本来就是整体替换params）
+@lru_cache(maxsize=1024)
+def _cached_params(*pairs) -> types.MappingProxyType:
+    return types.MappingProxyType(dict(pairs))
+
+
 # 创建操作的工厂函数
 def create_mouse_click(x: int, y: int, button: str = 'left') -> Action:
     """创建鼠标点击操作"""
     return Action(
         action_type=ActionType.MOUSE_CLICK,
-        params={'x': x, 'y': y, 'button': button}
+        params=_cached_params(('x', x), ('y', y), ('button', button))
     )
 
 
@@ -205,7 +450,7 @@ def create_mouse_double_click(x: int, y: int) -> Action:
     """创建鼠标双击操作"""
     return Action(
         action_type=ActionType.MOUSE_DOUBLE_CLICK,
-        params={'x': x, 'y': y}
+        params=_cached_params(('x', x), ('y', y))
     )
 
 
@@ -213,7 +458,7 @@ def create_mouse_right_click(x: int, y: int) -> Action:
     """创建鼠标右键操作"""
     return Action(
         action_type=ActionType.MOUSE_RIGHT_CLICK,
-        params={'x': x, 'y': y}
+        params=_cached_params(('x', x), ('y', y))
     )
 
 
@@ -221,7 +466,7 @@ def create_mouse_move(x: int, y: int, duration: float = 0.25) -> Action:
     """创建鼠标移动操作"""
     return Action(
         action_type=ActionType.MOUSE_MOVE,
-        params={'x': x, 'y': y, 'duration': duration}
+        params=_cached_params(('x', x), ('y', y), ('duration', duration))
     )
 
 
@@ -229,7 +474,7 @@ def create_mouse_drag(x: int, y: int, duration: float = 0.5) -> Action:
     """创建鼠标拖拽操作"""
     return Action(
         action_type=ActionType.MOUSE_DRAG,
-        params={'x': x, 'y': y, 'duration': duration}
+        params=_cached_params(('x', x), ('y', y), ('duration', duration))
     )
 
 
@@ -237,7 +482,7 @@ def create_mouse_scroll(amount: int, x: Optional[int] = None, y: Optional[int] =
     """创建鼠标滚轮操作"""
     return Action(
         action_type=ActionType.MOUSE_SCROLL,
-        params={'amount': amount, 'x': x, 'y': y}
+        params=_cached_params(('amount', amount), ('x', x), ('y', y))
     )
 
 
@@ -253,7 +498,7 @@ def create_keyboard_press(key: str, presses: int = 1) -> Action:
     """创建按键操作"""
     return Action(
         action_type=ActionType.KEYBOARD_PRESS,
-        params={'key': key, 'presses': presses}
+        params=_cached_params(('key', key), ('presses', presses))
     )
 
 
@@ -269,5 +514,5 @@ def create_delay(seconds: float) -> Action:
     """创建延迟操作"""
     return Action(
         action_type=ActionType.DELAY,
-        params={'seconds': seconds}
+        params=_cached_params(('seconds', seconds))
     )
@@ -5,20 +5,38 @@ PyQt5 主窗口界面
 import sys
 import os
 import json
+from functools import lru_cache, partial
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QSpinBox, QPushButton, QListWidget, QListWidgetItem,
+    QLabel, QSpinBox, QPushButton, QListView,
     QGroupBox, QComboBox, QLineEdit, QMessageBox, QDialog,
     QFormLayout, QDialogButtonBox, QFileDialog, QMenu, QAction,
     QCheckBox, QDoubleSpinBox, QFrame, QSplitter, QStatusBar,
-    QSystemTrayIcon, QStyle
+    QSystemTrayIcon, QStyle, QStackedWidget
+)
+from PyQt5.QtWidgets import QShortcut
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, QObject, QThread, QPoint, QStandardPaths,
+    QThreadPool, QRunnable, QAbstractListModel, QModelIndex
+)
+from PyQt5.QtGui import (
+    QFont, QIcon, QColor, QPalette, QCursor, QKeySequence
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread, QPoint, QStandardPaths
-from PyQt5.QtGui import QFont, QIcon, QColor, QPalette, QCursor
 from pynput import keyboard as pynput_keyboard
 
-# 添加项目根目录到路径
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+# 设置文件读写优先走orjson（C实现），未安装时退回标准库json；
+# 设置只给机器读，不缩进、不留分隔符空格，写入量最小
+try:
+    import orjson
+
+    _settings_dumps = orjson.dumps
+    _settings_loads = orjson.loads
+except ImportError:
+    def _settings_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+
+    _settings_loads = json.loads
 
 from src.core.scheduler import ShutdownScheduler
 from src.core.shutdown import ShutdownController
@@ -32,6 +50,76 @@ from src.automation.executor import ActionExecutor
 from src.automation.mouse_control import MouseController
 
 
+# 操作类型分组：frozenset成员判断O(1)，且不在每次调用时新建列表
+_MOUSE_COORD_TYPES = frozenset({
+    ActionType.MOUSE_CLICK, ActionType.MOUSE_DOUBLE_CLICK,
+    ActionType.MOUSE_RIGHT_CLICK, ActionType.MOUSE_MOVE,
+    ActionType.MOUSE_DRAG,
+})
+_MOUSE_MOVE_TYPES = frozenset({ActionType.MOUSE_MOVE, ActionType.MOUSE_DRAG})
+
+# 显示名在导入时取好，列表刷新的内层循环只做一次dict下标
+_TYPE_DISPLAY_NAMES = {t: t.get_display_name() for t in ActionType}
+
+# 禁用行前景色共享同一个实例（QColor写时复制，跨行共享安全）
+_DISABLED_FG = QColor(150, 150, 150)
+
+# 行文本模板绑定成可调用，重绘高频路径里复用同一个格式化对象
+_ROW_LABEL = "{}. [{}] {}".format
+
+# 按钮样式表为不可变字符串，提为模块常量避免每次打开窗口重新拼接
+_START_BTN_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+_CANCEL_BTN_QSS = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #da190b;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+# 倒计时颜色分档：≤30秒红色、≤60秒橙色、其余绿色
+_COUNTDOWN_COLORS = ("color: #f44336;", "color: #ff9800;", "color: #4CAF50;")
+
+_WARN_CANCEL_QSS = """
+    QPushButton {
+        background-color: #ff6b6b;
+        color: white;
+        border: none;
+        border-radius: 8px;
+    }
+    QPushButton:hover {
+        background-color: #ee5a5a;
+    }
+"""
+
+
+@lru_cache(maxsize=None)
+def _app_font(family: str, size: int, bold: bool = False) -> QFont:
+    """字体按(家族, 字号, 加粗)缓存；setFont会拷贝，实例可安全共享"""
+    return QFont(family, size, QFont.Bold if bold else QFont.Normal)
+
+
 def get_resource_path(relative_path: str) -> str:
     """获取资源文件路径（兼容开发与打包）"""
     if hasattr(sys, "_MEIPASS"):
@@ -42,14 +130,38 @@ def get_resource_path(relative_path: str) -> str:
 
 
 def get_settings_path() -> str:
-    """获取可写的设置文件路径（用户目录）"""
-    base_dir = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    """获取可写的设置文件路径（用户配置目录）"""
+    base_dir = QStandardPaths.writableLocation(
+        QStandardPaths.AppConfigLocation)
     if not base_dir:
         base_dir = os.path.expanduser("~")
     os.makedirs(base_dir, exist_ok=True)
     return os.path.join(base_dir, "settings.json")
 
 
+def _write_settings_atomic(path: str, payload: bytes):
+    """同目录临时文件+os.replace原子落盘，进程中途被杀也不会留半截JSON"""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+class _SettingsWriteTask(QRunnable):
+    """在线程池里写设置文件，UI线程只负责序列化"""
+
+    def __init__(self, path: str, payload: bytes):
+        super().__init__()
+        self._path = path
+        self._payload = payload
+
+    def run(self):
+        try:
+            _write_settings_atomic(self._path, self._payload)
+        except Exception as e:
+            print(f"保存设置失败: {e}")
+
+
 class MousePositionCapture(QDialog):
     """鼠标位置捕获对话框"""
     
@@ -65,71 +177,85 @@ class MousePositionCapture(QDialog):
         
         self.info_label = QLabel("按下 F2 键捕获当前鼠标位置（无需前台）\n按 ESC 取消")
         self.info_label.setAlignment(Qt.AlignCenter)
-        self.info_label.setFont(QFont("Microsoft YaHei", 12))
+        self.info_label.setFont(_app_font("Microsoft YaHei", 12))
         layout.addWidget(self.info_label)
         
         self.position_label = QLabel("当前位置: (-, -)")
         self.position_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.position_label)
         
-        # 定时更新鼠标位置
+        # 定时更新鼠标位置（100ms足够流畅，50ms会让进程每秒醒20次）；
+        # 由showEvent/done控制启停
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_position)
-        self.timer.start(50)
-        
+
         self.captured_x = 0
         self.captured_y = 0
-        self._hotkey_listener = None
-        self._start_global_hotkey_listener()
+        self._last_pos = None
+
+        # F2走主窗口的全局热键信号（应用级只有一个pynput监听线程），
+        # 找不到信号源时退回窗口内快捷键；ESC始终用QShortcut
+        self._f2_signal = None
+        self._f2_shortcut = QShortcut(QKeySequence(Qt.Key_F2), self,
+                                      activated=self._capture_from_hotkey)
+        QShortcut(QKeySequence(Qt.Key_Escape), self, activated=self.reject)
+
+    def _find_f2_signal(self):
+        """沿父链查找主窗口的f2_pressed信号
+
+        信号存在但监听线程没起来（pynput不可用）时返回None，
+        让调用方退回窗口内快捷键
+        """
+        widget = self.parent()
+        while widget is not None:
+            signal = getattr(widget, 'f2_pressed', None)
+            if signal is not None:
+                if getattr(widget, 'f2_hotkey_active', False):
+                    return signal
+                return None
+            widget = widget.parent()
+        return None
     
     def update_position(self):
         """更新鼠标位置显示"""
+        if not self.isVisible():
+            return
         try:
             x, y = MouseController.get_position()
-            self.position_label.setText(f"当前位置: ({x}, {y})")
             self.captured_x = x
             self.captured_y = y
+            # 位置没变就不重绘标签
+            if (x, y) == self._last_pos:
+                return
+            self._last_pos = (x, y)
+            self.position_label.setText(f"当前位置: ({x}, {y})")
         except:
             pass
 
-    def _start_global_hotkey_listener(self):
-        """启动全局热键监听（F2/ESC）"""
-        def on_press(key):
-            if key == pynput_keyboard.Key.f2:
-                QTimer.singleShot(0, self._capture_from_hotkey)
-            elif key == pynput_keyboard.Key.esc:
-                QTimer.singleShot(0, self.reject)
-
-        self._hotkey_listener = pynput_keyboard.Listener(on_press=on_press)
-        self._hotkey_listener.daemon = True
-        self._hotkey_listener.start()
-
-    def _stop_global_hotkey_listener(self):
-        """停止全局热键监听"""
-        if self._hotkey_listener:
-            self._hotkey_listener.stop()
-            self._hotkey_listener = None
-
     def _capture_from_hotkey(self):
         """从全局热键触发捕获"""
         self.position_captured.emit(self.captured_x, self.captured_y)
         self.accept()
-    
-    def keyPressEvent(self, event):
-        """按键事件"""
-        if event.key() == Qt.Key_F2:
-            self.position_captured.emit(self.captured_x, self.captured_y)
-            self.accept()
-        elif event.key() == Qt.Key_Escape:
-            self.reject()
-        else:
-            super().keyPressEvent(event)
-    
-    def closeEvent(self, event):
-        """关闭事件"""
+
+    def showEvent(self, event):
+        """显示时恢复轮询并接入全局F2信号（对话框实例被复用）"""
+        self._f2_signal = self._find_f2_signal()
+        if self._f2_signal is not None:
+            self._f2_signal.connect(self._capture_from_hotkey)
+        self._f2_shortcut.setEnabled(self._f2_signal is None)
+        self.timer.start(100)
+        super().showEvent(event)
+
+    def done(self, result):
+        """关闭（accept/reject的共同出口）：暂停轮询，实例留待复用"""
+        if self._f2_signal is not None:
+            try:
+                self._f2_signal.disconnect(self._capture_from_hotkey)
+            except TypeError:
+                pass
+            self._f2_signal = None
         self.timer.stop()
-        self._stop_global_hotkey_listener()
-        super().closeEvent(event)
+        super().done(result)
 
 
 class ActionEditDialog(QDialog):
@@ -138,6 +264,7 @@ class ActionEditDialog(QDialog):
     def __init__(self, action: Action = None, parent=None):
         super().__init__(parent)
         self.action = action
+        self._capture_dialog = None
         self.setWindowTitle("编辑操作" if action else "添加操作")
         self.setModal(True)
         self.resize(400, 300)
@@ -156,15 +283,14 @@ class ActionEditDialog(QDialog):
         type_layout.addWidget(QLabel("操作类型:"))
         self.type_combo = QComboBox()
         for action_type in ActionType:
-            self.type_combo.addItem(action_type.get_display_name(), action_type)
+            self.type_combo.addItem(_TYPE_DISPLAY_NAMES[action_type], action_type)
         self.type_combo.currentIndexChanged.connect(self.on_type_changed)
         type_layout.addWidget(self.type_combo)
         layout.addLayout(type_layout)
         
-        # 参数区域
-        self.params_widget = QWidget()
-        self.params_layout = QFormLayout(self.params_widget)
-        layout.addWidget(self.params_widget)
+        # 参数区域：每种操作类型一页，切换只做setCurrentWidget
+        self.params_stack = QStackedWidget()
+        layout.addWidget(self.params_stack)
         
         # 初始化参数控件
         self.setup_params_widgets()
@@ -180,193 +306,151 @@ class ActionEditDialog(QDialog):
         self.on_type_changed(0)
     
     def setup_params_widgets(self):
-        """创建所有可能的参数控件 - 保存默认值"""
-        # 保存默认值，每次切换类型时重新创建控件
-        self.default_values = {
-            'x': 0,
-            'y': 0,
-            'button': 'left',
-            'duration': 0.25,
-            'scroll': 0,
-            'text': '',
-            'key': '',
-            'hotkey': '',
-            'delay': 1.0,
-            'presses': 1
+        """预构建各操作类型的参数页（每个控件只创建一次）"""
+        # 鼠标页：点击/双击/右键/移动/拖拽/滚轮共用，行按类型显隐
+        self.page_mouse = QWidget()
+        mouse_form = QFormLayout(self.page_mouse)
+        mouse_form.setContentsMargins(0, 0, 0, 0)
+        self.coord_label = QLabel("坐标:")
+        mouse_form.addRow(self.coord_label, self._make_coord_row())
+        self._button_label = QLabel("鼠标按键:")
+        mouse_form.addRow(self._button_label, self._make_button_combo())
+        self._duration_label = QLabel("持续时间(秒):")
+        mouse_form.addRow(self._duration_label, self._make_duration_spin())
+        self._scroll_label = QLabel("滚动量(正向上):")
+        mouse_form.addRow(self._scroll_label, self._make_scroll_spin())
+
+        self.page_type = QWidget()
+        form = QFormLayout(self.page_type)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.addRow("输入文本:", self._make_text_edit())
+
+        self.page_press = QWidget()
+        form = QFormLayout(self.page_press)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.addRow("按键:", self._make_key_edit())
+        form.addRow("按键次数:", self._make_presses_spin())
+
+        self.page_hotkey = QWidget()
+        form = QFormLayout(self.page_hotkey)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.addRow("组合键:", self._make_hotkey_edit())
+
+        self.page_delay = QWidget()
+        form = QFormLayout(self.page_delay)
+        form.setContentsMargins(0, 0, 0, 0)
+        form.addRow("延迟时间(秒):", self._make_delay_spin())
+
+        for page in (self.page_mouse, self.page_type, self.page_press,
+                     self.page_hotkey, self.page_delay):
+            self.params_stack.addWidget(page)
+
+        self._type_page = {
+            ActionType.MOUSE_CLICK: self.page_mouse,
+            ActionType.MOUSE_DOUBLE_CLICK: self.page_mouse,
+            ActionType.MOUSE_RIGHT_CLICK: self.page_mouse,
+            ActionType.MOUSE_MOVE: self.page_mouse,
+            ActionType.MOUSE_DRAG: self.page_mouse,
+            ActionType.MOUSE_SCROLL: self.page_mouse,
+            ActionType.KEYBOARD_TYPE: self.page_type,
+            ActionType.KEYBOARD_PRESS: self.page_press,
+            ActionType.KEYBOARD_HOTKEY: self.page_hotkey,
+            ActionType.DELAY: self.page_delay,
         }
-    
-    def clear_params_layout(self):
-        """清空参数布局"""
-        while self.params_layout.count():
-            item = self.params_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
-    
+
+    def _make_coord_row(self) -> QWidget:
+        """坐标行容器（X/Y输入+捕获按钮）"""
+        self.x_spin = QSpinBox()
+        self.x_spin.setRange(0, 9999)
+
+        self.y_spin = QSpinBox()
+        self.y_spin.setRange(0, 9999)
+
+        self.capture_btn = QPushButton("捕获位置 (F2)")
+        self.capture_btn.clicked.connect(self.capture_position)
+
+        coord_widget = QWidget()
+        coord_layout = QHBoxLayout(coord_widget)
+        coord_layout.setContentsMargins(0, 0, 0, 0)
+        coord_layout.addWidget(QLabel("X:"))
+        coord_layout.addWidget(self.x_spin)
+        coord_layout.addWidget(QLabel("Y:"))
+        coord_layout.addWidget(self.y_spin)
+        coord_layout.addWidget(self.capture_btn)
+        return coord_widget
+
+    def _make_button_combo(self) -> QComboBox:
+        self.button_combo = QComboBox()
+        self.button_combo.addItems(["left", "right", "middle"])
+        return self.button_combo
+
+    def _make_duration_spin(self) -> QDoubleSpinBox:
+        self.duration_spin = QDoubleSpinBox()
+        self.duration_spin.setRange(0.0, 10.0)
+        self.duration_spin.setSingleStep(0.1)
+        self.duration_spin.setValue(0.25)
+        return self.duration_spin
+
+    def _make_scroll_spin(self) -> QSpinBox:
+        self.scroll_spin = QSpinBox()
+        self.scroll_spin.setRange(-100, 100)
+        return self.scroll_spin
+
+    def _make_text_edit(self) -> QLineEdit:
+        self.text_edit = QLineEdit()
+        return self.text_edit
+
+    def _make_key_edit(self) -> QLineEdit:
+        self.key_edit = QLineEdit()
+        self.key_edit.setPlaceholderText("如: enter, tab, f1, ctrl")
+        return self.key_edit
+
+    def _make_presses_spin(self) -> QSpinBox:
+        self.presses_spin = QSpinBox()
+        self.presses_spin.setRange(1, 100)
+        return self.presses_spin
+
+    def _make_hotkey_edit(self) -> QLineEdit:
+        self.hotkey_edit = QLineEdit()
+        self.hotkey_edit.setPlaceholderText("如: ctrl+c, alt+tab")
+        return self.hotkey_edit
+
+    def _make_delay_spin(self) -> QDoubleSpinBox:
+        self.delay_spin = QDoubleSpinBox()
+        self.delay_spin.setRange(0.0, 3600.0)
+        self.delay_spin.setSingleStep(0.5)
+        self.delay_spin.setValue(1.0)
+        return self.delay_spin
+
+    @staticmethod
+    def _set_row_visible(label, field, visible: bool):
+        """显隐表单行（标签和控件一起）"""
+        label.setVisible(visible)
+        field.setVisible(visible)
+
     def on_type_changed(self, index):
-        """操作类型改变时更新参数界面"""
-        # 保存当前值（如果控件存在）
-        if hasattr(self, 'x_spin') and self.x_spin is not None:
-            try:
-                self.default_values['x'] = self.x_spin.value()
-                self.default_values['y'] = self.y_spin.value()
-            except RuntimeError:
-                pass  # 控件已被删除
-        
-        if hasattr(self, 'button_combo') and self.button_combo is not None:
-            try:
-                self.default_values['button'] = self.button_combo.currentText()
-            except RuntimeError:
-                pass
-        
-        if hasattr(self, 'duration_spin') and self.duration_spin is not None:
-            try:
-                self.default_values['duration'] = self.duration_spin.value()
-            except RuntimeError:
-                pass
-        
-        if hasattr(self, 'scroll_spin') and self.scroll_spin is not None:
-            try:
-                self.default_values['scroll'] = self.scroll_spin.value()
-            except RuntimeError:
-                pass
-        
-        if hasattr(self, 'text_edit') and self.text_edit is not None:
-            try:
-                self.default_values['text'] = self.text_edit.text()
-            except RuntimeError:
-                pass
-        
-        if hasattr(self, 'key_edit') and self.key_edit is not None:
-            try:
-                self.default_values['key'] = self.key_edit.text()
-            except RuntimeError:
-                pass
-        
-        if hasattr(self, 'hotkey_edit') and self.hotkey_edit is not None:
-            try:
-                self.default_values['hotkey'] = self.hotkey_edit.text()
-            except RuntimeError:
-                pass
-        
-        if hasattr(self, 'delay_spin') and self.delay_spin is not None:
-            try:
-                self.default_values['delay'] = self.delay_spin.value()
-            except RuntimeError:
-                pass
-        
-        if hasattr(self, 'presses_spin') and self.presses_spin is not None:
-            try:
-                self.default_values['presses'] = self.presses_spin.value()
-            except RuntimeError:
-                pass
-        
-        self.clear_params_layout()
-        
+        """操作类型改变：切换参数页并调整鼠标页内各行的显隐"""
         action_type = self.type_combo.currentData()
-        
-        if action_type in [ActionType.MOUSE_CLICK, ActionType.MOUSE_DOUBLE_CLICK,
-                           ActionType.MOUSE_RIGHT_CLICK, ActionType.MOUSE_MOVE,
-                           ActionType.MOUSE_DRAG]:
-            # 重新创建控件
-            self.x_spin = QSpinBox()
-            self.x_spin.setRange(0, 9999)
-            self.x_spin.setValue(self.default_values['x'])
-            
-            self.y_spin = QSpinBox()
-            self.y_spin.setRange(0, 9999)
-            self.y_spin.setValue(self.default_values['y'])
-            
-            self.capture_btn = QPushButton("捕获位置 (F2)")
-            self.capture_btn.clicked.connect(self.capture_position)
-            
-            coord_widget = QWidget()
-            coord_layout = QHBoxLayout(coord_widget)
-            coord_layout.setContentsMargins(0, 0, 0, 0)
-            coord_layout.addWidget(QLabel("X:"))
-            coord_layout.addWidget(self.x_spin)
-            coord_layout.addWidget(QLabel("Y:"))
-            coord_layout.addWidget(self.y_spin)
-            coord_layout.addWidget(self.capture_btn)
-            self.params_layout.addRow("坐标:", coord_widget)
-            
-            if action_type == ActionType.MOUSE_CLICK:
-                self.button_combo = QComboBox()
-                self.button_combo.addItems(["left", "right", "middle"])
-                index = self.button_combo.findText(self.default_values['button'])
-                if index >= 0:
-                    self.button_combo.setCurrentIndex(index)
-                self.params_layout.addRow("鼠标按键:", self.button_combo)
-            
-            if action_type in [ActionType.MOUSE_MOVE, ActionType.MOUSE_DRAG]:
-                self.duration_spin = QDoubleSpinBox()
-                self.duration_spin.setRange(0.0, 10.0)
-                self.duration_spin.setSingleStep(0.1)
-                self.duration_spin.setValue(self.default_values['duration'])
-                self.params_layout.addRow("持续时间(秒):", self.duration_spin)
-        
-        elif action_type == ActionType.MOUSE_SCROLL:
-            # 重新创建控件
-            self.x_spin = QSpinBox()
-            self.x_spin.setRange(0, 9999)
-            self.x_spin.setValue(self.default_values['x'])
-            
-            self.y_spin = QSpinBox()
-            self.y_spin.setRange(0, 9999)
-            self.y_spin.setValue(self.default_values['y'])
-            
-            self.capture_btn = QPushButton("捕获位置 (F2)")
-            self.capture_btn.clicked.connect(self.capture_position)
-            
-            self.scroll_spin = QSpinBox()
-            self.scroll_spin.setRange(-100, 100)
-            self.scroll_spin.setValue(self.default_values['scroll'])
-            
-            coord_widget = QWidget()
-            coord_layout = QHBoxLayout(coord_widget)
-            coord_layout.setContentsMargins(0, 0, 0, 0)
-            coord_layout.addWidget(QLabel("X:"))
-            coord_layout.addWidget(self.x_spin)
-            coord_layout.addWidget(QLabel("Y:"))
-            coord_layout.addWidget(self.y_spin)
-            coord_layout.addWidget(self.capture_btn)
-            self.params_layout.addRow("位置(可选):", coord_widget)
-            self.params_layout.addRow("滚动量(正向上):", self.scroll_spin)
-        
-        elif action_type == ActionType.KEYBOARD_TYPE:
-            self.text_edit = QLineEdit()
-            self.text_edit.setText(self.default_values['text'])
-            self.params_layout.addRow("输入文本:", self.text_edit)
-        
-        elif action_type == ActionType.KEYBOARD_PRESS:
-            self.key_edit = QLineEdit()
-            self.key_edit.setPlaceholderText("如: enter, tab, f1, ctrl")
-            self.key_edit.setText(self.default_values['key'])
-            
-            self.presses_spin = QSpinBox()
-            self.presses_spin.setRange(1, 100)
-            self.presses_spin.setValue(self.default_values['presses'])
-            
-            self.params_layout.addRow("按键:", self.key_edit)
-            self.params_layout.addRow("按键次数:", self.presses_spin)
-        
-        elif action_type == ActionType.KEYBOARD_HOTKEY:
-            self.hotkey_edit = QLineEdit()
-            self.hotkey_edit.setPlaceholderText("如: ctrl+c, alt+tab")
-            self.hotkey_edit.setText(self.default_values['hotkey'])
-            self.params_layout.addRow("组合键:", self.hotkey_edit)
-        
-        elif action_type == ActionType.DELAY:
-            self.delay_spin = QDoubleSpinBox()
-            self.delay_spin.setRange(0.0, 3600.0)
-            self.delay_spin.setSingleStep(0.5)
-            self.delay_spin.setValue(self.default_values['delay'])
-            self.params_layout.addRow("延迟时间(秒):", self.delay_spin)
+        page = self._type_page[action_type]
+
+        if page is self.page_mouse:
+            is_scroll = action_type == ActionType.MOUSE_SCROLL
+            self.coord_label.setText("位置(可选):" if is_scroll else "坐标:")
+            self._set_row_visible(self._button_label, self.button_combo,
+                                  action_type == ActionType.MOUSE_CLICK)
+            self._set_row_visible(self._duration_label, self.duration_spin,
+                                  action_type in _MOUSE_MOVE_TYPES)
+            self._set_row_visible(self._scroll_label, self.scroll_spin,
+                                  is_scroll)
+
+        self.params_stack.setCurrentWidget(page)
     
     def capture_position(self):
-        """捕获鼠标位置"""
-        dialog = MousePositionCapture(self)
-        dialog.position_captured.connect(self.on_position_captured)
-        dialog.exec_()
+        """捕获鼠标位置（对话框惰性创建一次，之后重复使用）"""
+        if self._capture_dialog is None:
+            self._capture_dialog = MousePositionCapture(self)
+            self._capture_dialog.position_captured.connect(self.on_position_captured)
+        self._capture_dialog.exec_()
     
     def on_position_captured(self, x, y):
         """位置捕获回调"""
@@ -383,9 +467,7 @@ class ActionEditDialog(QDialog):
         
         params = action.params
         
-        if action.action_type in [ActionType.MOUSE_CLICK, ActionType.MOUSE_DOUBLE_CLICK,
-                                   ActionType.MOUSE_RIGHT_CLICK, ActionType.MOUSE_MOVE,
-                                   ActionType.MOUSE_DRAG]:
+        if action.action_type in _MOUSE_COORD_TYPES:
             self.x_spin.setValue(params.get('x', 0))
             self.y_spin.setValue(params.get('y', 0))
             if 'button' in params:
@@ -419,14 +501,12 @@ class ActionEditDialog(QDialog):
         action_type = self.type_combo.currentData()
         params = {}
         
-        if action_type in [ActionType.MOUSE_CLICK, ActionType.MOUSE_DOUBLE_CLICK,
-                           ActionType.MOUSE_RIGHT_CLICK, ActionType.MOUSE_MOVE,
-                           ActionType.MOUSE_DRAG]:
+        if action_type in _MOUSE_COORD_TYPES:
             params['x'] = self.x_spin.value()
             params['y'] = self.y_spin.value()
             if action_type == ActionType.MOUSE_CLICK:
                 params['button'] = self.button_combo.currentText()
-            if action_type in [ActionType.MOUSE_MOVE, ActionType.MOUSE_DRAG]:
+            if action_type in _MOUSE_MOVE_TYPES:
                 params['duration'] = self.duration_spin.value()
         
         elif action_type == ActionType.MOUSE_SCROLL:
@@ -477,102 +557,194 @@ class WarningDialog(QDialog):
         
         # 警告图标和文字
         warning_label = QLabel("⚠️ 系统即将关机！")
-        warning_label.setFont(QFont("Microsoft YaHei", 16, QFont.Bold))
+        warning_label.setFont(_app_font("Microsoft YaHei", 16, bold=True))
         warning_label.setAlignment(Qt.AlignCenter)
         warning_label.setStyleSheet("color: #ff6b6b;")
         layout.addWidget(warning_label)
         
         # 倒计时显示
         self.countdown_label = QLabel(f"剩余 {seconds} 秒")
-        self.countdown_label.setFont(QFont("Microsoft YaHei", 24, QFont.Bold))
+        self.countdown_label.setFont(_app_font("Microsoft YaHei", 24, bold=True))
         self.countdown_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.countdown_label)
         
         # 取消按钮
         self.cancel_btn = QPushButton("取消关机")
-        self.cancel_btn.setFont(QFont("Microsoft YaHei", 12))
+        self.cancel_btn.setFont(_app_font("Microsoft YaHei", 12))
         self.cancel_btn.setMinimumHeight(50)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff6b6b;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #ee5a5a;
-            }
-        """)
+        self.cancel_btn.setStyleSheet(_WARN_CANCEL_QSS)
         self.cancel_btn.clicked.connect(self.on_cancel)
         layout.addWidget(self.cancel_btn)
-        
-        # 倒计时更新
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_countdown)
-        self.timer.start(1000)
-    
-    def update_countdown(self):
-        """更新倒计时"""
-        self.remaining -= 1
-        if self.remaining <= 0:
-            self.timer.stop()
-            self.accept()
-        else:
-            self.countdown_label.setText(f"剩余 {self.remaining} 秒")
-    
+
     def on_cancel(self):
         """取消关机"""
-        self.timer.stop()
         self.cancelled.emit()
         self.reject()
-    
+
     def update_remaining(self, seconds: int):
-        """更新剩余时间"""
+        """更新剩余时间（由主窗口的倒计时信号驱动，对话框不再自带定时器）"""
         self.remaining = seconds
-        self.countdown_label.setText(f"剩余 {seconds} 秒")
+        if seconds <= 0:
+            self.accept()
+        else:
+            self.countdown_label.setText(f"剩余 {seconds} 秒")
 
 
-class ExecutionThread(QThread):
-    """操作执行线程"""
-    
+class ExecutionSignals(QObject):
+    """执行任务的信号载体（QRunnable不继承QObject，信号要挂在这里）"""
+
     action_started = pyqtSignal(str, int)  # action_id, index
     action_completed = pyqtSignal(str, int)  # action_id, index
     sequence_completed = pyqtSignal()
     error_occurred = pyqtSignal(str, str)  # error_msg, action_id
-    
-    def __init__(self, sequence: ActionSequence, parent=None):
-        super().__init__(parent)
+
+
+class ExecutionRunnable(QRunnable):
+    """在全局线程池中执行操作序列
+
+    QThreadPool复用OS线程，每次执行不再有起线程的开销；
+    setAutoDelete让Qt在run结束后回收C++侧对象，
+    Python侧属性（executor/signals）由调用方的引用保活
+    """
+
+    def __init__(self, sequence: ActionSequence):
+        super().__init__()
         self.sequence = sequence
+        self.signals = ExecutionSignals()
         self.executor = ActionExecutor()
-    
+        # 回调在构造时绑定一次，run不再每次重建闭包；
+        # 绑定方法比闭包少一层Python帧
+        self.executor.set_on_action_start(self._emit_started)
+        self.executor.set_on_action_complete(self._emit_completed)
+        self.executor.set_on_error(self._emit_error)
+        self.setAutoDelete(True)
+
+    def _emit_started(self, action, index):
+        self.signals.action_started.emit(action.id, index)
+
+    def _emit_completed(self, action, index):
+        self.signals.action_completed.emit(action.id, index)
+
+    def _emit_error(self, e, action):
+        self.signals.error_occurred.emit(str(e), action.id)
+
     def run(self):
-        """执行操作序列"""
-        def on_start(action, index):
-            self.action_started.emit(action.id, index)
-        
-        def on_complete(action, index):
-            self.action_completed.emit(action.id, index)
-        
-        def on_error(e, action):
-            self.error_occurred.emit(str(e), action.id)
-        
-        self.executor.set_on_action_start(on_start)
-        self.executor.set_on_action_complete(on_complete)
-        self.executor.set_on_error(on_error)
-        
-        self.executor.execute_sequence(self.sequence)
-        self.sequence_completed.emit()
-    
+        """执行操作序列（池线程降为低优先级，不抢UI线程的调度）"""
+        thread = QThread.currentThread()
+        thread.setPriority(QThread.LowPriority)
+        try:
+            self.executor.execute_sequence(self.sequence)
+            self.signals.sequence_completed.emit()
+        finally:
+            # 线程会被池复用，退出前恢复默认优先级
+            thread.setPriority(QThread.NormalPriority)
+
     def stop(self):
         """停止执行"""
         self.executor.stop()
 
+    @property
+    def is_running(self) -> bool:
+        """是否正在执行"""
+        return self.executor.is_running
+
+
+class ActionListModel(QAbstractListModel):
+    """操作序列列表模型
+
+    直接以ActionSequence为后备存储，增删改只发精确的模型信号，
+    视图按需重绘受影响的行；序号前缀由data()按行号现算，
+    行移动/删除后不必手动修正
+    """
+
+    def __init__(self, sequence: ActionSequence, parent=None):
+        super().__init__(parent)
+        self._sequence = sequence
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._sequence.actions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        action = self.action_at(index.row())
+        if action is None:
+            return None
+        if role == Qt.DisplayRole:
+            return _ROW_LABEL(index.row() + 1,
+                              _TYPE_DISPLAY_NAMES[action.action_type],
+                              action.description)
+        if role == Qt.ForegroundRole and not action.enabled:
+            return _DISABLED_FG
+        if role == Qt.UserRole:
+            return action.id
+        return None
+
+    def action_at(self, row: int):
+        """取指定行的Action，行号越界返回None"""
+        actions = self._sequence.actions
+        return actions[row] if 0 <= row < len(actions) else None
+
+    def set_sequence(self, sequence: ActionSequence):
+        """整体替换底层序列（加载文件后调用）"""
+        self.beginResetModel()
+        self._sequence = sequence
+        self.endResetModel()
+
+    def add(self, action: Action):
+        """追加操作"""
+        row = len(self._sequence.actions)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._sequence.add_action(action)
+        self.endInsertRows()
+
+    def remove(self, row: int):
+        """删除指定行"""
+        action = self.action_at(row)
+        if action is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._sequence.remove_action(action.id)
+        self.endRemoveRows()
+        self._renumber(row, len(self._sequence.actions) - 1)
+
+    def move(self, src: int, dst: int):
+        """移动一行（dst为移动后的行号）"""
+        # Qt的moveRows目标语义：向下移动时目标行号要加1
+        qt_dst = dst + 1 if dst > src else dst
+        if not self.beginMoveRows(QModelIndex(), src, src,
+                                  QModelIndex(), qt_dst):
+            return
+        self._sequence.move_action(src, dst)
+        self.endMoveRows()
+        self._renumber(min(src, dst), max(src, dst))
+
+    def refresh_row(self, row: int):
+        """单行内容变化后通知视图重绘"""
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
+    def _renumber(self, first: int, last: int):
+        """序号前缀变化的行区间发dataChanged"""
+        if 0 <= first <= last < len(self._sequence.actions):
+            self.dataChanged.emit(self.index(first), self.index(last),
+                                  [Qt.DisplayRole])
+
+    def clear(self):
+        """清空所有行"""
+        self.beginResetModel()
+        self._sequence.clear()
+        self.endResetModel()
+
 
 class MainWindow(QMainWindow):
     """主窗口"""
     countdown_tick = pyqtSignal(int)
     countdown_warning = pyqtSignal(int)
     countdown_complete = pyqtSignal()
+    f2_pressed = pyqtSignal()
     
     def __init__(self):
         super().__init__()
@@ -586,26 +758,79 @@ class MainWindow(QMainWindow):
         # 初始化组件
         self.scheduler = ShutdownScheduler()
         self.sequence = ActionSequence()
-        self.execution_thread = None
+        self.execution_runnable = None
         self.warning_dialog = None
         self._system_shutdown_scheduled = False
+        self._color_bucket = None
+        self._last_time_str = None
+        self._last_remaining = None
+        self._pending_status = None
+        self._last_settings_hash = None
+        self._test_total = 0
         
         self.setup_ui()
         self.setup_scheduler()
-        self.setup_tray()
-        
-        # 加载保存的设置
-        self.load_settings()
+
+        # 托盘图标和设置加载推迟到事件循环启动后，
+        # 先让窗口完成首次绘制再做磁盘IO
+        QTimer.singleShot(0, self.setup_tray)
+        QTimer.singleShot(0, self.load_settings)
 
         # 线程安全的UI更新信号
         self.countdown_tick.connect(self._update_countdown_display)
         self.countdown_warning.connect(self._show_warning_dialog)
         self.countdown_complete.connect(self._execute_shutdown)
-        
-        # 启动UI更新定时器
-        self.ui_timer = QTimer(self)
-        self.ui_timer.timeout.connect(self.update_ui_state)
-        self.ui_timer.start(100)
+
+        # 按钮状态只在选中项变化时才需要刷新，不必用定时器轮询
+        self.actions_list.selectionModel().selectionChanged.connect(
+            self.update_ui_state)
+        self.update_ui_state()
+
+        # 右键菜单只建一次，弹出时仅重绑当前行的触发参数
+        self._context_menu = QMenu(self)
+        self._ctx_edit = self._context_menu.addAction("编辑")
+        self._ctx_toggle = self._context_menu.addAction("启用/禁用")
+        self._context_menu.addSeparator()
+        self._ctx_delete = self._context_menu.addAction("删除")
+        self._ctx_delete.triggered.connect(self.delete_action)
+
+        # 设置写盘走专用单线程池：写与写之间天然串行，也不跟执行序列
+        # 的全局池抢线程（序列里的sleep会占满全局池，拖延排队的写任务）
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
+        # 设置项变更防抖保存：500ms内的连续改动合并为一次后台写盘
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_settings_async)
+        for spin in (self.hours_spin, self.minutes_spin, self.seconds_spin):
+            spin.valueChanged.connect(self._on_setting_changed)
+        for check in (self.force_check, self.run_actions_check,
+                      self.warning_check):
+            check.toggled.connect(self._on_setting_changed)
+
+        # 全局F2热键：整个应用只开一个pynput监听线程，
+        # 捕获对话框按需连接f2_pressed信号，不再各自启停监听器
+        self._global_hotkeys = None
+        self.f2_hotkey_active = False
+        try:
+            self._global_hotkeys = pynput_keyboard.GlobalHotKeys(
+                {'<f2>': self.f2_pressed.emit})
+            self._global_hotkeys.start()
+            self.f2_hotkey_active = True
+        except Exception as e:
+            print(f"启动全局热键监听失败: {e}")
+
+    def _stop_global_hotkeys(self):
+        """停止全局热键监听线程（仅在退出时调用）"""
+        self.f2_hotkey_active = False
+        if self._global_hotkeys is not None:
+            try:
+                self._global_hotkeys.stop()
+            except Exception as e:
+                print(f"停止全局热键监听失败: {e}")
+            self._global_hotkeys = None
     
     def setup_ui(self):
         """设置界面"""
@@ -618,7 +843,7 @@ class MainWindow(QMainWindow):
         
         # 标题
         title_label = QLabel("TaskOff 定时关机工具")
-        title_label.setFont(QFont("Microsoft YaHei", 18, QFont.Bold))
+        title_label.setFont(_app_font("Microsoft YaHei", 18, bold=True))
         title_label.setAlignment(Qt.AlignCenter)
         main_layout.addWidget(title_label)
         
@@ -670,14 +895,14 @@ class MainWindow(QMainWindow):
         display_layout = QVBoxLayout(display_group)
         
         self.countdown_display = QLabel("00:00:00")
-        self.countdown_display.setFont(QFont("Consolas", 48, QFont.Bold))
+        self.countdown_display.setFont(_app_font("Consolas", 48, bold=True))
         self.countdown_display.setAlignment(Qt.AlignCenter)
         self.countdown_display.setStyleSheet("color: #4CAF50;")
         display_layout.addWidget(self.countdown_display)
         
         self.status_label = QLabel("就绪")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setFont(QFont("Microsoft YaHei", 12))
+        self.status_label.setFont(_app_font("Microsoft YaHei", 12))
         display_layout.addWidget(self.status_label)
         
         left_layout.addWidget(display_group)
@@ -687,41 +912,15 @@ class MainWindow(QMainWindow):
         
         self.start_btn = QPushButton("▶ 开始")
         self.start_btn.setMinimumHeight(50)
-        self.start_btn.setFont(QFont("Microsoft YaHei", 12))
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.start_btn.setFont(_app_font("Microsoft YaHei", 12))
+        self.start_btn.setStyleSheet(_START_BTN_QSS)
         self.start_btn.clicked.connect(self.start_countdown)
         control_layout.addWidget(self.start_btn)
         
         self.cancel_btn = QPushButton("■ 取消")
         self.cancel_btn.setMinimumHeight(50)
-        self.cancel_btn.setFont(QFont("Microsoft YaHei", 12))
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                border-radius: 8px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.cancel_btn.setFont(_app_font("Microsoft YaHei", 12))
+        self.cancel_btn.setStyleSheet(_CANCEL_BTN_QSS)
         self.cancel_btn.clicked.connect(self.cancel_countdown)
         self.cancel_btn.setEnabled(False)
         control_layout.addWidget(self.cancel_btn)
@@ -756,10 +955,12 @@ class MainWindow(QMainWindow):
         actions_layout = QVBoxLayout(actions_group)
         
         # 操作列表
-        self.actions_list = QListWidget()
+        self.actions_model = ActionListModel(self.sequence, self)
+        self.actions_list = QListView()
+        self.actions_list.setModel(self.actions_model)
         self.actions_list.setContextMenuPolicy(Qt.CustomContextMenu)
         self.actions_list.customContextMenuRequested.connect(self.show_action_menu)
-        self.actions_list.itemDoubleClicked.connect(self.edit_action)
+        self.actions_list.doubleClicked.connect(self.edit_action)
         actions_layout.addWidget(self.actions_list)
         
         # 操作按钮
@@ -874,6 +1075,7 @@ class MainWindow(QMainWindow):
             return
         
         self.scheduler.start(total_seconds)
+        self._last_remaining = None
         self._update_countdown_display(total_seconds)
         self.start_btn.setEnabled(False)
         self.cancel_btn.setEnabled(True)
@@ -891,13 +1093,16 @@ class MainWindow(QMainWindow):
             self.warning_dialog.reject()
             self.warning_dialog = None
         
-        if self.execution_thread and self.execution_thread.isRunning():
-            self.execution_thread.stop()
+        if self.execution_runnable and self.execution_runnable.is_running:
+            self.execution_runnable.stop()
         
         self.start_btn.setEnabled(True)
         self.cancel_btn.setEnabled(False)
         self.countdown_display.setText("00:00:00")
-        self.countdown_display.setStyleSheet("color: #4CAF50;")
+        self.countdown_display.setStyleSheet(_COUNTDOWN_COLORS[2])
+        self._color_bucket = 2
+        self._last_time_str = None
+        self._last_remaining = None
         self.status_label.setText("已取消")
         self.statusBar.showMessage("倒计时已取消")
     
@@ -908,19 +1113,25 @@ class MainWindow(QMainWindow):
     
     def _update_countdown_display(self, remaining: int):
         """更新倒计时显示"""
-        self.countdown_display.setText(ShutdownScheduler.format_time(remaining))
-        
-        # 最后30秒变红
-        if remaining <= 30:
-            self.countdown_display.setStyleSheet("color: #f44336;")
-        elif remaining <= 60:
-            self.countdown_display.setStyleSheet("color: #ff9800;")
-        else:
-            self.countdown_display.setStyleSheet("color: #4CAF50;")
-        
-        # 更新托盘提示
-        self.tray_icon.setToolTip(f"TaskOff - 剩余 {ShutdownScheduler.format_time(remaining)}")
-        
+        # 跨线程队列里积压的旧tick直接丢弃，只处理最新的剩余时间
+        if self._last_remaining is not None and remaining >= self._last_remaining:
+            return
+        self._last_remaining = remaining
+
+        # 格式化字符串是秒级精度，没变化就跳过标签重绘和托盘IPC
+        time_str = ShutdownScheduler.format_time(remaining)
+        if time_str != self._last_time_str:
+            self._last_time_str = time_str
+            self.countdown_display.setText(time_str)
+            self.tray_icon.setToolTip(f"TaskOff - 剩余 {time_str}")
+
+        # 颜色只在跨过30/60秒阈值时才重设样式表，
+        # 免得每秒触发一次Qt样式重解析
+        bucket = 0 if remaining <= 30 else 1 if remaining <= 60 else 2
+        if bucket != self._color_bucket:
+            self._color_bucket = bucket
+            self.countdown_display.setStyleSheet(_COUNTDOWN_COLORS[bucket])
+
         # 更新警告对话框
         if self.warning_dialog and self.warning_dialog.isVisible():
             self.warning_dialog.update_remaining(remaining)
@@ -939,26 +1150,45 @@ class MainWindow(QMainWindow):
         self.activateWindow()
         self.raise_()
     
+    def showEvent(self, event):
+        """从托盘恢复显示时，补上隐藏期间挂起的状态栏消息"""
+        if self._pending_status is not None:
+            self.statusBar.showMessage(self._pending_status)
+            self._pending_status = None
+        super().showEvent(event)
+
+    def _show_status(self, message: str):
+        """显示状态栏消息；窗口隐藏时只记住最新一条，恢复时再补"""
+        if self.isVisible():
+            self.statusBar.showMessage(message)
+        else:
+            self._pending_status = message
+
     def on_countdown_complete(self):
         """倒计时完成回调"""
         self.countdown_complete.emit()
     
     def _execute_shutdown(self):
         """执行关机"""
+        # 调度器到零只发完成信号不再发tick，警告对话框在这里显式收掉
+        if self.warning_dialog and self.warning_dialog.isVisible():
+            self.warning_dialog.accept()
+
         self.status_label.setText("正在执行...")
         
         # 先执行自动化操作
         if self.run_actions_check.isChecked() and len(self.sequence.actions) > 0:
-            self.statusBar.showMessage("正在执行自动化操作...")
-            self.execution_thread = ExecutionThread(self.sequence, self)
-            self.execution_thread.sequence_completed.connect(self._do_shutdown)
-            self.execution_thread.start()
+            self._show_status("正在执行自动化操作...")
+            self.execution_runnable = ExecutionRunnable(self.sequence)
+            self.execution_runnable.signals.sequence_completed.connect(
+                self._do_shutdown)
+            QThreadPool.globalInstance().start(self.execution_runnable)
         else:
             self._do_shutdown()
     
     def _do_shutdown(self):
         """执行关机命令"""
-        self.statusBar.showMessage("正在关机...")
+        self._show_status("正在关机...")
         ShutdownController.shutdown(
             delay=0,
             force=self.force_check.isChecked(),
@@ -967,98 +1197,85 @@ class MainWindow(QMainWindow):
     
     def update_ui_state(self):
         """更新UI状态"""
-        has_selection = len(self.actions_list.selectedItems()) > 0
+        has_selection = self.actions_list.selectionModel().hasSelection()
         self.edit_btn.setEnabled(has_selection)
         self.delete_btn.setEnabled(has_selection)
         self.move_up_btn.setEnabled(has_selection)
         self.move_down_btn.setEnabled(has_selection)
     
-    def refresh_actions_list(self):
-        """刷新操作列表"""
-        self.actions_list.clear()
-        for i, action in enumerate(self.sequence.actions):
-            item = QListWidgetItem(f"{i+1}. [{action.action_type.get_display_name()}] {action.description}")
-            item.setData(Qt.UserRole, action.id)
-            if not action.enabled:
-                item.setForeground(QColor(150, 150, 150))
-            self.actions_list.addItem(item)
-    
     def add_action(self):
         """添加操作"""
         dialog = ActionEditDialog(parent=self)
         if dialog.exec_() == QDialog.Accepted:
             action = dialog.get_action()
-            self.sequence.add_action(action)
-            self.refresh_actions_list()
+            self.actions_model.add(action)
+            self.update_ui_state()
             self.statusBar.showMessage(f"已添加操作: {action.description}")
-    
-    def edit_action(self, item: QListWidgetItem):
+
+    def edit_action(self, index: QModelIndex):
         """编辑操作（双击）"""
-        action_id = item.data(Qt.UserRole)
-        action = self.sequence.get_action(action_id)
+        action = self.actions_model.action_at(index.row())
         if action:
             dialog = ActionEditDialog(action, parent=self)
             if dialog.exec_() == QDialog.Accepted:
                 dialog.get_action()  # 更新action
-                self.refresh_actions_list()
-    
+                self.actions_model.refresh_row(index.row())
+
     def edit_selected_action(self):
         """编辑选中的操作"""
-        items = self.actions_list.selectedItems()
-        if items:
-            self.edit_action(items[0])
-    
+        indexes = self.actions_list.selectedIndexes()
+        if indexes:
+            self.edit_action(indexes[0])
+
     def delete_action(self):
         """删除操作"""
-        items = self.actions_list.selectedItems()
-        if items:
-            action_id = items[0].data(Qt.UserRole)
-            self.sequence.remove_action(action_id)
-            self.refresh_actions_list()
+        indexes = self.actions_list.selectedIndexes()
+        if indexes:
+            self.actions_model.remove(indexes[0].row())
+            self.update_ui_state()
             self.statusBar.showMessage("已删除操作")
-    
+
     def move_action_up(self):
         """上移操作"""
-        current_row = self.actions_list.currentRow()
+        current_row = self.actions_list.currentIndex().row()
         if current_row > 0:
-            self.sequence.move_action(current_row, current_row - 1)
-            self.refresh_actions_list()
-            self.actions_list.setCurrentRow(current_row - 1)
-    
+            self.actions_model.move(current_row, current_row - 1)
+            self.actions_list.setCurrentIndex(
+                self.actions_model.index(current_row - 1))
+
     def move_action_down(self):
         """下移操作"""
-        current_row = self.actions_list.currentRow()
-        if current_row < len(self.sequence.actions) - 1:
-            self.sequence.move_action(current_row, current_row + 1)
-            self.refresh_actions_list()
-            self.actions_list.setCurrentRow(current_row + 1)
-    
+        current_row = self.actions_list.currentIndex().row()
+        if 0 <= current_row < len(self.sequence.actions) - 1:
+            self.actions_model.move(current_row, current_row + 1)
+            self.actions_list.setCurrentIndex(
+                self.actions_model.index(current_row + 1))
+
     def show_action_menu(self, pos: QPoint):
-        """显示操作右键菜单"""
-        item = self.actions_list.itemAt(pos)
-        if item:
-            menu = QMenu(self)
-            
-            edit_action = menu.addAction("编辑")
-            edit_action.triggered.connect(lambda: self.edit_action(item))
-            
-            toggle_action = menu.addAction("启用/禁用")
-            toggle_action.triggered.connect(lambda: self.toggle_action(item))
-            
-            menu.addSeparator()
-            
-            delete_action = menu.addAction("删除")
-            delete_action.triggered.connect(self.delete_action)
-            
-            menu.exec_(self.actions_list.mapToGlobal(pos))
-    
-    def toggle_action(self, item: QListWidgetItem):
+        """显示操作右键菜单（复用同一个QMenu，只重绑当前行）"""
+        index = self.actions_list.indexAt(pos)
+        if index.isValid():
+            # 断开上一次行的绑定；首次弹出时尚无连接
+            try:
+                self._ctx_edit.triggered.disconnect()
+            except TypeError:
+                pass
+            try:
+                self._ctx_toggle.triggered.disconnect()
+            except TypeError:
+                pass
+            # partial是C层对象，比lambda少一次函数对象+cell的分配
+            self._ctx_edit.triggered.connect(partial(self.edit_action, index))
+            self._ctx_toggle.triggered.connect(
+                partial(self.toggle_action, index))
+            self._context_menu.exec_(self.actions_list.mapToGlobal(pos))
+
+    def toggle_action(self, index: QModelIndex):
         """切换操作启用状态"""
-        action_id = item.data(Qt.UserRole)
-        action = self.sequence.get_action(action_id)
+        action = self.actions_model.action_at(index.row())
         if action:
             action.enabled = not action.enabled
-            self.refresh_actions_list()
+            self.actions_model.refresh_row(index.row())
     
     def test_sequence(self):
         """测试运行操作序列"""
@@ -1079,39 +1296,62 @@ class MainWindow(QMainWindow):
     def _run_test(self):
         """执行测试"""
         self.statusBar.showMessage("正在测试运行...")
-        self.execution_thread = ExecutionThread(self.sequence, self)
-        self.execution_thread.action_started.connect(
-            lambda id, idx: self.statusBar.showMessage(f"执行操作 {idx+1}/{len(self.sequence.actions)}")
-        )
-        self.execution_thread.sequence_completed.connect(
-            lambda: self.statusBar.showMessage("测试完成")
-        )
-        self.execution_thread.error_occurred.connect(
-            lambda err, id: QMessageBox.warning(self, "错误", f"操作执行失败: {err}")
-        )
-        self.execution_thread.start()
+        self.execution_runnable = ExecutionRunnable(self.sequence)
+        # 序列长度在一次运行中不变，提前算好，进度回调里不再len()
+        self._test_total = len(self.sequence.actions)
+        signals = self.execution_runnable.signals
+        signals.action_started.connect(self._on_test_action_started)
+        signals.sequence_completed.connect(self._on_test_completed)
+        signals.error_occurred.connect(self._on_test_error)
+        QThreadPool.globalInstance().start(self.execution_runnable)
+
+    def _on_test_action_started(self, action_id: str, index: int):
+        """测试运行进度回调（窗口隐藏时不触碰状态栏）"""
+        self._show_status(f"执行操作 {index+1}/{self._test_total}")
+
+    def _on_test_completed(self):
+        """测试运行完成回调"""
+        self._show_status("测试完成")
+
+    def _on_test_error(self, error_msg: str, action_id: str):
+        """测试运行出错回调"""
+        QMessageBox.warning(self, "错误", f"操作执行失败: {error_msg}")
     
     def save_sequence(self):
         """保存操作序列"""
-        filepath, _ = QFileDialog.getSaveFileName(
-            self, "保存操作序列", "", "JSON文件 (*.json)"
-        )
+        # open()非阻塞弹出，事件循环继续跑，倒计时照常刷新
+        dialog = QFileDialog(self, "保存操作序列", "", "JSON文件 (*.json)")
+        dialog.setAcceptMode(QFileDialog.AcceptSave)
+        dialog.setDefaultSuffix("json")
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._do_save_sequence)
+        dialog.open()
+
+    def _do_save_sequence(self, filepath: str):
+        """文件选定后的实际保存"""
         if filepath:
             try:
                 self.sequence.save_to_file(filepath)
                 self.statusBar.showMessage(f"已保存到: {filepath}")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"保存失败: {e}")
-    
+
     def load_sequence(self):
         """加载操作序列"""
-        filepath, _ = QFileDialog.getOpenFileName(
-            self, "加载操作序列", "", "JSON文件 (*.json)"
-        )
+        dialog = QFileDialog(self, "加载操作序列", "", "JSON文件 (*.json)")
+        dialog.setAcceptMode(QFileDialog.AcceptOpen)
+        dialog.setFileMode(QFileDialog.ExistingFile)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(self._do_load_sequence)
+        dialog.open()
+
+    def _do_load_sequence(self, filepath: str):
+        """文件选定后的实际加载"""
         if filepath:
             try:
                 self.sequence = ActionSequence.load_from_file(filepath)
-                self.refresh_actions_list()
+                self.actions_model.set_sequence(self.sequence)
+                self.update_ui_state()
                 self.statusBar.showMessage(f"已加载: {filepath}")
             except Exception as e:
                 QMessageBox.critical(self, "错误", f"加载失败: {e}")
@@ -1124,8 +1364,8 @@ class MainWindow(QMainWindow):
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
-                self.sequence.clear()
-                self.refresh_actions_list()
+                self.actions_model.clear()
+                self.update_ui_state()
                 self.statusBar.showMessage("已清空操作序列")
     
     def on_tray_activated(self, reason):
@@ -1146,6 +1386,7 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.Yes:
                 self.cancel_countdown()
                 self.save_settings()
+                self._stop_global_hotkeys()
                 event.accept()
             elif reply == QMessageBox.No:
                 event.ignore()
@@ -1154,51 +1395,96 @@ class MainWindow(QMainWindow):
                 event.ignore()
         else:
             self.save_settings()
+            self._stop_global_hotkeys()
             event.accept()
-    
+
     def quit_app(self):
         """退出应用"""
         self.cancel_countdown()
         self.save_settings()
+        self._stop_global_hotkeys()
         self.tray_icon.hide()
         QApplication.quit()
     
+    def _collect_settings(self) -> dict:
+        """收集当前设置（必须在UI线程调用）"""
+        # 尺寸取geometry()一次拿够；坐标必须用pos()——load_settings用
+        # move()恢复，move()吃的是含边框的框架坐标，存客户区坐标会导致
+        # 窗口每次启动向右下漂移一个标题栏
+        g = self.geometry()
+        p = self.pos()
+        return {
+            'countdown': {
+                'hours': self.hours_spin.value(),
+                'minutes': self.minutes_spin.value(),
+                'seconds': self.seconds_spin.value(),
+            },
+            'options': {
+                'force_close': self.force_check.isChecked(),
+                'run_actions': self.run_actions_check.isChecked(),
+                'warning_popup': self.warning_check.isChecked(),
+            },
+            'window': {
+                'width': g.width(),
+                'height': g.height(),
+                'x': p.x(),
+                'y': p.y(),
+            }
+        }
+
+    def _on_setting_changed(self, *args):
+        """设置项变化：重置防抖计时，静默500ms后才真正落盘"""
+        self._save_timer.start()
+
+    def _settings_payload(self):
+        """序列化当前设置；与上次落盘内容相同时返回None"""
+        payload = _settings_dumps(self._collect_settings())
+        h = hash(payload)
+        if h == self._last_settings_hash:
+            return None
+        self._last_settings_hash = h
+        return payload
+
+    def _save_settings_async(self):
+        """UI线程序列化，文件写入交给全局线程池"""
+        try:
+            payload = self._settings_payload()
+            if payload is None:
+                return
+            self._save_pool.start(_SettingsWriteTask(
+                self._get_settings_file(), payload))
+        except Exception as e:
+            print(f"保存设置失败: {e}")
+
     def save_settings(self):
-        """保存设置到文件"""
+        """同步保存设置到文件（退出路径的强制落盘）"""
+        self._save_timer.stop()
+        # 等后台写任务全部收尾，排队的旧内容不可能晚到覆盖这次的结果
+        self._save_pool.waitForDone()
         try:
-            settings_file = self._get_settings_file()
-            settings = {
-                'countdown': {
-                    'hours': self.hours_spin.value(),
-                    'minutes': self.minutes_spin.value(),
-                    'seconds': self.seconds_spin.value(),
-                },
-                'options': {
-                    'force_close': self.force_check.isChecked(),
-                    'run_actions': self.run_actions_check.isChecked(),
-                    'warning_popup': self.warning_check.isChecked(),
-                },
-                'window': {
-                    'width': self.width(),
-                    'height': self.height(),
-                    'x': self.x(),
-                    'y': self.y(),
-                }
-            }
-            with open(settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
+            payload = self._settings_payload()
+            if payload is None:
+                return
+            _write_settings_atomic(self._get_settings_file(), payload)
         except Exception as e:
             print(f"保存设置失败: {e}")
     
     def load_settings(self):
         """从文件加载设置"""
         try:
-            settings_file = self._get_settings_file()
-            if not os.path.exists(settings_file):
+            # 直接open省掉一次exists的stat，文件不存在走异常分支
+            try:
+                f = open(self._get_settings_file(), 'rb')
+            except FileNotFoundError:
                 return
-            
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
+            with f:
+                data = f.read()
+            # 空文件不进解析器
+            if not data:
+                return
+            settings = _settings_loads(data)
+            # 记住磁盘上的内容，设置没改过就不会再写回
+            self._last_settings_hash = hash(data)
             
             # 加载倒计时设置
             countdown = settings.get('countdown', {})